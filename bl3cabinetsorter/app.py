@@ -28,17 +28,28 @@ import git
 import enum
 import gzip
 import json
+import hashlib
+import io
 import lzma
 import html
 import jinja2
 import logging
+import itertools
 import datetime
 import traceback
 import collections
+import concurrent.futures
 import Levenshtein
 import configparser
 import urllib.parse
 
+# orjson is optional, but it's quite a bit faster than the stdlib json
+# module for reading and writing our caches.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class Re(object):
     """
     Class to allow us to use a Perl-like regex-comparison idiom
@@ -71,6 +82,9 @@ class DirInfo(object):
     and provide some useful methods to get at it.
     """
 
+    __slots__ = ('repo_dir', 'dirpath', 'rel_dirpath', 'dir_author',
+            'folded_mapping', 'rel_paths', 'mtimes', 'extension_map', 'no_extension', 'readme')
+
     def __init__(self, repo_dir, dirpath, filenames):
         """
         Initialize given our current dir path, and a list of filenames
@@ -78,63 +92,80 @@ class DirInfo(object):
         self.repo_dir = repo_dir
         self.dirpath = dirpath
         self.rel_dirpath = dirpath[len(self.repo_dir)+1:]
-        path_components = self.rel_dirpath.split(os.sep)
-        if path_components and path_components[0] != '':
-            self.dir_author = path_components[0]
-        else:
-            self.dir_author = '(unknown)'
-        self.cur_path = path_components[-1]
-        self.lower_mapping = {}
-        self.extension_map = {}
+        # The author is always the top-level dir; we don't need the rest
+        self.dir_author = self.rel_dirpath.partition(os.sep)[0] or '(unknown)'
+        # Filenames are all matched case-insensitively, so everything gets
+        # keyed on the casefolded version of the name.
+        self.folded_mapping = {}
+        self.rel_paths = {}
+        self.mtimes = {}
+        extension_map = collections.defaultdict(list)
         self.no_extension = []
         self.readme = None
         for n in filenames:
-            lower = n.lower()
-            if '.' in lower:
-                ext = lower.split('.')[-1]
+            folded = n.casefold()
+            if '.' in folded:
+                # The extension is everything after the last dot, even for
+                # dotfiles (so a bare `.bl3hotfix` still counts as a mod).
+                # Compressed files get the "inner" extension as well.
+                (root, _, ext) = folded.rpartition('.')
                 if ext == 'gz':
-                    ext = '.'.join(lower.split('.')[-2:])
-                if ext not in self.extension_map:
-                    self.extension_map[ext] = [lower]
-                else:
-                    self.extension_map[ext].append(lower)
+                    ext = f"{root.rpartition('.')[2]}.{ext}"
+                extension_map[ext].append(folded)
             else:
-                self.no_extension.append(lower)
-            self.lower_mapping[lower] = os.path.join(dirpath, n)
+                self.no_extension.append(folded)
+            self.folded_mapping[folded] = os.path.join(dirpath, n)
 
             # We're assuming there'll only be one README in any given
             # dir, which is probably safe enough, and I don't think I
             # care enough to try and prioritize, in dirs where there
-            # might be more than one
-            if 'readme' in lower and '.swp' not in lower:
-                self.readme = lower
+            # might be more than one.  Vim swapfiles are skipped.  This is
+            # checked with plain substring tests since it runs on every
+            # file in the repo.
+            if 'readme' in folded and '.swp' not in folded:
+                self.readme = folded
+
+        # Convert back to a regular dict so that lookups for missing
+        # extensions don't add anything.  The lists get sorted once here,
+        # so that callers get a stable order no matter what order the
+        # filesystem handed them to us in.
+        self.extension_map = {ext: sorted(files) for (ext, files) in extension_map.items()}
+        self.no_extension.sort()
 
     def __getitem__(self, key):
         """
         Pretend to be a dict
         """
-        return self.lower_mapping[key.lower()]
+        return self.folded_mapping[key.casefold()]
 
     def __contains__(self, key):
         """
         Return whether or not we contain the given filename
         """
-        return key.lower() in self.lower_mapping
+        return key.casefold() in self.folded_mapping
 
     def get_all(self):
         """
         Returns all files
         """
-        return self.lower_mapping.keys()
+        return self.folded_mapping.keys()
 
     def get_all_with_ext(self, extension):
         """
         Returns all files with the given extension
         """
-        if extension in self.extension_map:
-            return self.extension_map[extension]
-        else:
-            return []
+        return self.extension_map.get(extension, [])
+
+    def get_all_with_exts(self, extensions):
+        """
+        Returns all files with any of the given extensions, in the order
+        the extensions were given
+        """
+        files = []
+        for extension in extensions:
+            if extension in self.extension_map:
+                files.extend(self.extension_map[extension])
+        return files
 
     def get_all_no_ext(self):
         """
@@ -145,12 +176,117 @@ class DirInfo(object):
     def get_rel_path(self, filename):
         """
         Returns a tuple with the relative path to the directory containing
-        the given file, and the relative path to the file itself
+        the given file, and the relative path to the file itself.  These
+        get remembered, in case we're asked more than once.
+        """
+        folded = filename.casefold()
+        if folded not in self.rel_paths:
+            self.rel_paths[folded] = (
+                    self.rel_dirpath,
+                    self.folded_mapping[folded][len(self.repo_dir)+1:],
+                    )
+        return self.rel_paths[folded]
+
+    def get_mtime(self, filename):
         """
-        return (
-            self.rel_dirpath,
-            self[filename][len(self.repo_dir)+1:],
-            )
+        Returns the mtime of the given file.  These get remembered as
+        well, so we only stat each file once per run.
+        """
+        folded = filename.casefold()
+        if folded not in self.mtimes:
+            self.mtimes[folded] = os.stat(self.folded_mapping[folded]).st_mtime
+        return self.mtimes[folded]
+
+class TemplateDirInfo(DirInfo):
+    """
+    A DirInfo for our templates dir, which we only ever need mtimes from.
+    This is populated from a single `os.scandir()` call, and the resulting
+    DirEntry objects cache their own stat results.
+    """
+
+    __slots__ = ('entries',)
+
+    def __init__(self, dirpath):
+        with os.scandir(dirpath) as it:
+            self.entries = {e.name.casefold(): e for e in it if e.is_file()}
+        super().__init__('', dirpath, [e.name for e in self.entries.values()])
+
+    def get_mtime(self, filename):
+        """
+        Returns the mtime of the given file, from our scandir() results
+        """
+        return self.entries[filename.casefold()].stat().st_mtime
+
+def data_hash(data):
+    """
+    Returns a hash of the given bytes `data`, suitable for storing in our
+    caches.
+    """
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+def content_hash(filename):
+    """
+    Returns a hash of the contents of the given `filename`, suitable for
+    storing in our caches.  We use this to tell when a file's mtime has
+    changed without its contents actually changing (which happens all the
+    time after a fresh clone or a `git pull`).  The file is read in
+    chunks, so we never need to hold the whole thing in memory.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    with open(filename, 'rb') as df:
+        while chunk := df.read(65536):
+            h.update(chunk)
+    return h.hexdigest()
+
+# Our caches get rewritten on most runs, so favor compression speed over
+# ratio.  Reading is about as fast no matter which preset wrote the file.
+CACHE_LZMA_PRESET = 1
+
+# Magic bytes at the start of any .xz stream
+XZ_MAGIC = b'\xfd7zXZ\x00'
+
+def cache_read(filename):
+    """
+    Reads the full decompressed contents of one of our cache files.  The
+    caches are always read and written whole, so this is done in one shot
+    rather than through a file object.  Caches are normally lzma-compressed,
+    but uncompressed ones are detected and read as-is.
+    """
+    with open(filename, 'rb') as df:
+        data = df.read()
+    if data.startswith(XZ_MAGIC):
+        return lzma.decompress(data)
+    return data
+
+def cache_write(filename, data, compress=True):
+    """
+    Writes the bytes `data` out to the cache file `filename`, in one shot.
+    The data is lzma-compressed unless `compress` is `False`.
+    """
+    if compress:
+        data = lzma.compress(data, preset=CACHE_LZMA_PRESET)
+    with open(filename, 'wb') as df:
+        df.write(data)
+
+def cache_dumps(obj):
+    """
+    Serializes `obj` into compact JSON bytes for our cache files, using
+    orjson if it's available.
+    """
+    if orjson:
+        return orjson.dumps(obj)
+    # `json.dump()` streams through the pure-Python encoder, whereas
+    # `json.dumps()` can use the C one, so build the whole string first.
+    return json.dumps(obj, separators=(',', ':'), check_circular=False).encode('utf-8')
+
+def cache_loads(data):
+    """
+    Unserializes the JSON bytes `data` from one of our cache files, using
+    orjson if it's available.
+    """
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
 
 class Cacheable(object):
     """
@@ -166,6 +302,8 @@ class Cacheable(object):
     though you'll have to cope with having a "pretend" mtime with each object.
     """
 
+    __slots__ = ('mtime', 'status', 'content_hash')
+
     cache_key = None
 
     (S_UNKNOWN,
@@ -180,6 +318,19 @@ class Cacheable(object):
             S_UPDATED: 'Updated',
             }
 
+    # What our status becomes once our data's been changed.  New objects
+    # stay new; everything else is updated.
+    S_AFTER_UPDATE = {
+            S_UNKNOWN: S_UPDATED,
+            S_CACHED: S_UPDATED,
+            S_NEW: S_NEW,
+            S_UPDATED: S_UPDATED,
+            }
+
+    # Statuses which no data change can move us out of, so there's no point
+    # comparing old and new data while we're in one.
+    S_UPDATE_FINAL = frozenset({S_NEW, S_UPDATED})
+
     def __init__(self, mtime, initial_status=S_UNKNOWN):
         """
         Note that implementing classes, in order to be used with FileCache,
@@ -193,6 +344,39 @@ class Cacheable(object):
         """
         self.mtime = mtime
         self.status = initial_status
+        self.content_hash = None
+
+    def mark_updated(self):
+        """
+        Updates our status to reflect that our data has changed
+        """
+        self.status = Cacheable.S_AFTER_UPDATE[self.status]
+
+    def set_mtime(self, mtime):
+        """
+        Records a new mtime for our file, when its contents are known not
+        to have changed.  Reimplement this in the inheriting class if there's
+        anything else which is derived from our mtime.
+        """
+        self.mtime = mtime
+
+    def carry_over(self, old):
+        """
+        Called when we're replacing the previously-cached object `old` for
+        the same file.  Reimplement this in the inheriting class to hang on
+        to anything from `old` which isn't derived from the file itself.
+        """
+        pass
+
+    def reattach(self, **extra):
+        """
+        Called on objects which were constructed in another process (see
+        `FileCache.load_many()`), once they're back in ours, with the same
+        `extra` constructor arguments.  Reimplement this in the inheriting
+        class if anything from those needs to be our own copy rather than
+        the one which came back across the process boundary.
+        """
+        pass
 
     def has_errors(self):
         """
@@ -209,8 +393,10 @@ class Cacheable(object):
         d = self._serialize()
         if self.has_errors():
             d['m'] = 0
+            d['ch'] = None
         else:
             d['m'] = self.mtime
+            d['ch'] = self.content_hash
         return d
 
     def _serialize(self): # pragma: nocover
@@ -225,6 +411,8 @@ class Cacheable(object):
         Creates a new ModFile given the specified serialized dict
         """
         obj = cache_class(input_dict['m'], initial_status=Cacheable.S_CACHED)
+        # Content hashes were added after the fact, so they may be missing
+        obj.content_hash = input_dict.get('ch')
         obj._unserialize(input_dict)
         return obj
 
@@ -241,6 +429,8 @@ class TemplateMTime(Cacheable):
     we care about is the mtime.
     """
 
+    __slots__ = ()
+
     cache_key = 'template'
 
     def __init__(self, mtime, dirinfo=None, filename=None, initial_status=Cacheable.S_UNKNOWN):
@@ -252,21 +442,45 @@ class TemplateMTime(Cacheable):
     def _unserialize(self, input_dict):
         pass
 
+class WikiPage(Cacheable):
+    """
+    Info about a page we've written out to the wiki.  The content hash is
+    of what we wrote, and the mtime is that of the file once it was written,
+    so we can tell if something else has touched it since.
+    """
+
+    __slots__ = ()
+
+    cache_key = 'pages'
+
+    def __init__(self, mtime, dirinfo=None, filename=None, initial_status=Cacheable.S_UNKNOWN):
+        super().__init__(mtime, initial_status)
+
+    def _serialize(self):
+        return {}
+
+    def _unserialize(self, input_dict):
+        pass
+
 class Author(Cacheable):
     """
     Info about a mod author.
     """
 
+    __slots__ = ('name', 'mods', 'cur_mods', '_wiki_filename')
+
     cache_key = 'author'
 
-    regular_modlink_re = re.compile('^\[\[(.*?)\|.*\]\].*$')
-    html_modlink_re = re.compile('^<a href=.*?>(.*)</a>.*$')
+    # Matches either of the link styles we use on author pages (plain wiki
+    # links or HTML), capturing the link text in group 1 or 2 respectively.
+    modlink_re = re.compile(r'^(?:\[\[(.*?)\|.*\]\]|<a href=.*?>(.*)</a>).*$')
 
     def __init__(self, mtime, initial_status=Cacheable.S_UNKNOWN, name=None):
         super().__init__(mtime, initial_status)
         self.name = name
         self.mods = set()
         self.cur_mods = set()
+        self._wiki_filename = None
 
     def _serialize(self):
         return {
@@ -288,15 +502,15 @@ class Author(Cacheable):
         return self.status
 
     def wiki_filename(self):
-        global wiki_filename
-        return wiki_filename(self.name)
+        # Computed lazily, since our name isn't known until after unserializing
+        if self._wiki_filename is None:
+            self._wiki_filename = wiki_filename(self.name)
+        return self._wiki_filename
 
     def wiki_link_html(self):
-        global wiki_link_html
         return wiki_link_html(self.name, self.name)
 
     def wiki_link(self):
-        global wiki_link
         return wiki_link(self.name, self.name)
 
     def rel_url(self):
@@ -317,12 +531,9 @@ class Author(Cacheable):
         Key to use when sorting between two different wiki link syntaxes
         """
         ml_lower = modlist_link.lower()
-        match = Author.regular_modlink_re.match(ml_lower)
+        match = Author.modlink_re.match(ml_lower)
         if match:
-            return match.group(1)
-        match = Author.html_modlink_re.match(ml_lower)
-        if match:
-            return match.group(1)
+            return match.group(match.lastindex)
         return ml_lower
 
 class ModURL(object):
@@ -338,14 +549,15 @@ class ModURL(object):
     """
 
     def __init__(self, link_text):
-        if '|' in link_text:
-            (self.text, self.url) = link_text.split('|', 1)
+        (text, sep, url) = link_text.partition('|')
+        if sep:
+            self.text = text
+            self.url = url
         else:
             self.url = link_text
             self.text = None
 
     def wiki_link(self):
-        global wiki_link
         if self.text:
             return wiki_link(self.text, self.url, external=True)
         else:
@@ -387,6 +599,7 @@ class FakeMod:
 
     def __init__(self, mod_title, author_text):
         self.mod_title = mod_title
+        self.mod_title_lower = mod_title.lower()
         self.author_text = author_text
         self.is_real = False
 
@@ -394,14 +607,12 @@ class FakeMod:
         """
         Sort by mod title
         """
-        return self.mod_title.lower() < other.mod_title.lower()
+        return self.mod_title_lower < other.mod_title_lower
 
     def wiki_link(self):
-        global wiki_link
         return wiki_link(self.mod_title, self.mod_title)
 
     def wiki_link_html(self):
-        global wiki_link_html
         return wiki_link_html(self.mod_title, self.mod_title)
 
 class TagType(enum.Enum):
@@ -413,17 +624,34 @@ class ModFile(Cacheable):
     Class to pull info out of a mod file.
     """
 
+    __slots__ = ('error_list', 'valid_categories', 'mod_time',
+            '_mod_title', 'mod_title_lower', 'mod_title_display',
+            '_mod_author', 'mod_author_lower', 'other_authors', '_authors_set',
+            'version', 'license', 'license_url',
+            'contact', 'contact_email', 'contact_discord',
+            'wiki_filename_base', 'mod_desc', 'readme_rel', 'readme_desc',
+            'homepage', 'nexus_link', 'screenshots', 'video_urls', 'urls',
+            'categories', 'changelog', 'related_links', '_related_links_sorted',
+            'pakfile', 'render_key', 'errors', 'is_real', 'is_pak_only',
+            'seen', 'full_filename', 'rel_path', 'rel_filename')
+
     cache_key = 'mods'
 
+    # Splits up a (stripped) comma-separated list of categories, taking
+    # care of any whitespace around each one at the same time.
+    category_split_re = re.compile(r'\s*,\s*')
+
     def __init__(self, mtime, dirinfo=None, filename=None, initial_status=Cacheable.S_UNKNOWN,
             error_list=None, valid_categories=None):
         super().__init__(mtime, initial_status)
         self.error_list = error_list
         self.valid_categories = valid_categories
         self.mod_time = datetime.datetime.fromtimestamp(mtime)
-        self.mod_title = None
+        self._mod_title = None
+        self.mod_title_lower = None
         self.mod_title_display = None
         self._mod_author = None
+        self.mod_author_lower = None
         self.other_authors = []
         self._authors_set = set()
         self.version = None
@@ -444,8 +672,9 @@ class ModFile(Cacheable):
         self.categories = set()
         self.changelog = []
         self.related_links = []
+        self._related_links_sorted = None
         self.pakfile = None
-        self.re = Re()
+        self.render_key = None
         self.errors = False
         self.is_real = True
 
@@ -462,31 +691,27 @@ class ModFile(Cacheable):
             self.rel_filename = temp_rel_filename.split(os.path.sep)[-1]
             self.mod_author = dirinfo.dir_author
 
-            # We're going to do a preload here as utf-8 (the default),
-            # to see if we can read it as utf-8.  There are a number of
-            # base Borderlands objects which are latin1, so we can't
-            # use utf-8 for those, but other mod files use unicode chars
-            # in their category names, and I'd like to be able to read
-            # those properly.
-            if self.full_filename.endswith('.gz'):
-                try:
-                    with gzip.open(self.full_filename, mode='rt', encoding='utf-8') as df:
-                        df.read()
-                    encoding = 'utf-8'
-                except UnicodeDecodeError:
-                    encoding = 'latin1'
-            else:
-                try:
-                    with open(self.full_filename, encoding='utf-8') as df:
-                        df.read()
-                    encoding = 'utf-8'
-                except UnicodeDecodeError:
-                    encoding = 'latin1'
-
+            # Read the whole file in once, and then try decoding it as utf-8
+            # (the default).  There are a number of base Borderlands objects
+            # which are latin1, so we can't use utf-8 for those, but other
+            # mod files use unicode chars in their category names, and I'd
+            # like to be able to read those properly.  Parsing happens from
+            # an in-memory copy, so the file never has to be opened (or
+            # decompressed) a second time.
             if self.full_filename.endswith('.gz'):
-                df = gzip.open(self.full_filename, mode='rt', encoding=encoding)
+                with gzip.open(self.full_filename) as df:
+                    data = df.read()
             else:
-                df = open(self.full_filename, encoding=encoding)
+                with open(self.full_filename, 'rb') as df:
+                    data = df.read()
+            try:
+                contents = data.decode('utf-8')
+            except UnicodeDecodeError:
+                contents = data.decode('latin1')
+
+            # newline=None gives us the same universal-newline handling we'd
+            # get from opening the file in text mode
+            df = io.StringIO(contents, newline=None)
             first_line = df.readline()
             while first_line.strip() == '':
                 first_line = df.readline()
@@ -544,7 +769,7 @@ class ModFile(Cacheable):
                 'r': self.readme_desc,
                 'l': self.readme_rel,
                 'o': self.changelog,
-                'e': sorted(self.related_links),
+                'e': self.related_links_sorted(),
                 'h': homepage,
                 'n': nl,
                 's': [str(s) for s in self.screenshots],
@@ -552,6 +777,7 @@ class ModFile(Cacheable):
                 'u': [str(u) for u in self.urls],
                 'c': list(self.categories),
                 'p': self.pakfile,
+                'rk': self.render_key,
                 }
 
     def _unserialize(self, input_dict):
@@ -586,6 +812,7 @@ class ModFile(Cacheable):
         self.readme_rel = input_dict['l']
         self.changelog = input_dict['o']
         self.related_links = set(input_dict['e'])
+        self._related_links_sorted = None
         if input_dict['n']:
             self.nexus_link = ModURL(input_dict['n'])
         else:
@@ -598,7 +825,9 @@ class ModFile(Cacheable):
         self.screenshots = [ModURL(u) for u in input_dict['s']]
         self.video_urls = [ModURL(u) for u in input_dict['y']]
         self.urls = [ModURL(u) for u in input_dict['u']]
-        self.categories = set(input_dict['c'])
+        # Interned so that these are the same objects as App's own
+        # (also interned) category keys
+        self.categories = {sys.intern(c) for c in input_dict['c']}
 
         # Contact fields, added 2021-06-16
         if 'cg' in input_dict and input_dict['cg']:
@@ -620,12 +849,92 @@ class ModFile(Cacheable):
         else:
             self.pakfile = None
 
+        # Render key, added 2026-10-16
+        if 'rk' in input_dict:
+            self.render_key = input_dict['rk']
+        else:
+            self.render_key = None
+
+    def set_mtime(self, mtime):
+        """
+        Records a new mtime for our file, keeping our displayed mod time
+        in step with it.
+        """
+        super().set_mtime(mtime)
+        self.mod_time = datetime.datetime.fromtimestamp(mtime)
+
+    def reattach(self, valid_categories=None, **extra):
+        """
+        After being parsed in another process, our categories are copies
+        of the category strings, and we have our own copy of the whole
+        valid-category table.  Swap both back for the canonical objects.
+        """
+        self.valid_categories = valid_categories
+        self.categories = {valid_categories[cat] for cat in self.categories}
+
+    def carry_over(self, old):
+        """
+        Hang on to the render key of the page we last wrote out, so that a
+        re-parse which doesn't change anything on the page (as happens every
+        run for mods with errors) doesn't trigger a re-render.
+        """
+        self.render_key = old.render_key
+
+    def check_render_key(self, *extra):
+        """
+        Computes our current render key (see `get_render_key`), storing it
+        if it's changed.  Returns `True` if our page needs rendering again.
+        """
+        render_key = self.get_render_key(*extra)
+        if render_key == self.render_key:
+            return False
+        self.render_key = render_key
+        return True
+
+    def get_render_key(self, *extra):
+        """
+        Returns a key which describes everything that goes into rendering our
+        wiki page, so we can tell if it needs rendering again.  Anything in
+        `extra` which the page also depends on (such as the template) will
+        be mixed in as well.
+        """
+        d = self._serialize()
+        del d['rk']
+        d['c'] = sorted(d['c'])
+        # This deliberately sticks with the stdlib json module, so that the
+        # key doesn't change depending on whether orjson is installed.
+        return data_hash(json.dumps([
+            d,
+            self.mod_time.date().isoformat(),
+            extra,
+            ], sort_keys=True).encode('utf-8'))
+
     def get_full_rel_filename(self):
         """
         Returns our "full" relative filename
         """
         return os.path.join(self.rel_path, self.rel_filename)
 
+    @property
+    def mod_title(self):
+        """
+        Return our mod_title.  This is a property so that we can keep a
+        lowercase version around, which gets used a lot while sorting and
+        resolving name conflicts.
+        """
+        return self._mod_title
+
+    @mod_title.setter
+    def mod_title(self, title):
+        """
+        Sets our mod title, along with its lowercase version
+        """
+        self._mod_title = title
+        if title is None:
+            self.mod_title_lower = None
+        else:
+            self.mod_title_lower = title.lower()
+
     @property
     def mod_author(self):
         """
@@ -641,41 +950,44 @@ class ModFile(Cacheable):
         """
         self._mod_author = author
         if author is None:
+            self.mod_author_lower = None
             self._authors_set = set()
         else:
-            self._authors_set = {author.lower()}
+            self.mod_author_lower = author.lower()
+            self._authors_set = {self.mod_author_lower}
+
+    def _touch(self, changed):
+        """
+        Marks us as having been seen on this run, and as updated if our
+        data has `changed`
+        """
+        self.seen = True
+        if changed:
+            self.mark_updated()
 
     def set_title_display(self, mod_title_display):
         """
         Sets our display title (for links), updating our status if need be
         """
-        self.seen = True
-        if mod_title_display != self.mod_title_display:
-            if self.status != Cacheable.S_NEW:
-                self.status = Cacheable.S_UPDATED
-            self.mod_title_display = mod_title_display
+        self._touch(mod_title_display != self.mod_title_display)
+        self.mod_title_display = mod_title_display
 
     def set_wiki_filename_base(self, wiki_filename_base):
         """
         Sets our wiki filename base, updating our status if need be
         """
-        self.seen = True
-        if wiki_filename_base != self.wiki_filename_base:
-            if self.status != Cacheable.S_NEW:
-                self.status = Cacheable.S_UPDATED
-            self.wiki_filename_base = wiki_filename_base
+        self._touch(wiki_filename_base != self.wiki_filename_base)
+        self.wiki_filename_base = wiki_filename_base
 
     def set_related_links(self, related_mods):
         """
         Sets our new related links given a set of other mods
         """
-        new_links = set(
-            ['{}, by {}'.format(m.wiki_link(), m.mod_author) for m in related_mods]
-            )
+        new_links = {'{}, by {}'.format(m.wiki_link(), m.mod_author) for m in related_mods}
         if new_links != self.related_links:
-            if self.status != Cacheable.S_NEW:
-                self.status = Cacheable.S_UPDATED
+            self.mark_updated()
             self.related_links = new_links
+            self._related_links_sorted = None
 
     def update_readme_desc(self, readme, new_desc):
         """
@@ -685,11 +997,9 @@ class ModFile(Cacheable):
             new_readme_rel = readme.rel_filename
         else:
             new_readme_rel = None
-        self.seen = True
-        if (self.status != Cacheable.S_NEW and
+        self._touch(self.status not in Cacheable.S_UPDATE_FINAL and
                 (new_desc != self.readme_desc
-                    or new_readme_rel != self.readme_rel)):
-            self.status = Cacheable.S_UPDATED
+                    or new_readme_rel != self.readme_rel))
         self.readme_desc = new_desc
         self.readme_rel = new_readme_rel
 
@@ -697,9 +1007,8 @@ class ModFile(Cacheable):
         """
         Updates our changelog data with the given array
         """
-        self.seen = True
-        if self.status != Cacheable.S_NEW and new_changelog != self.changelog:
-            self.status = Cacheable.S_UPDATED
+        self._touch(self.status not in Cacheable.S_UPDATE_FINAL
+                and new_changelog != self.changelog)
         self.changelog = new_changelog
 
     def add_other_author(self, other_author):
@@ -771,7 +1080,9 @@ class ModFile(Cacheable):
         found_raw_comment = False
         found_empty_line_after_tags = False
         tag_type = None
-        for line in df.readlines():
+        # Iterating lazily rather than via readlines(), since the bulk of
+        # any mod file is the hotfixes themselves, which we never look at.
+        for line in df:
             # If we get to a `Spark` line, break
             if line.startswith('Spark'):
                 # If we have unprocessed comment lines and we have *not* had any
@@ -800,11 +1111,9 @@ class ModFile(Cacheable):
                 # a "bare" comment is specified, but other processors might not, and
                 # in the end, who cares?
                 if stripped.startswith('#'):
-                    stripped = stripped.lstrip('#')
                     # Only strip a single space char after hashes, in case the in-mod
                     # description is using some indents
-                    if len(stripped) > 0 and stripped[0] == ' ':
-                        stripped = stripped[1:]
+                    stripped = stripped.lstrip('#').removeprefix(' ')
 
                 if found_raw_comment:
                     cur_section.append(stripped)
@@ -817,228 +1126,10 @@ class ModFile(Cacheable):
                         elif ': ' in stripped:
                             tag_type = TagType.ORIG
 
-                    processed_tag = False
-
-                    # Process original-style tags
-                    if tag_type == TagType.ORIG:
-                        if ': ' in stripped:
-                            processed_tag = True
-                            key, val = stripped.split(': ', 1)
-                            key = key.strip().lower()
-                            val = val.strip()
-                            if key == 'name':
-                                if not self.mod_title:
-                                    self.mod_title = val
-                                else:
-                                    self.errors = True
-                                    self.error_list.append('WARNING: More than one mod name specified in `{}/{}`'.format(
-                                        self.rel_path,
-                                        self.rel_filename,
-                                        ))
-                            elif key == 'author':
-                                self.add_other_author(val)
-                            elif key == 'contact':
-                                self.contact = val
-                            elif key == 'contact (email)':
-                                self.contact_email = val
-                            elif key == 'contact (discord)':
-                                self.contact_discord = val
-                            elif key == 'version':
-                                if not self.version:
-                                    self.version = val
-                                else:
-                                    self.errors = True
-                                    self.error_list.append('WARNING: More than one version specified in `{}/{}`'.format(
-                                        self.rel_path,
-                                        self.rel_filename,
-                                        ))
-                            elif key == 'categories':
-                                for cat in [c.strip().lower() for c in val.split(',')]:
-                                    if cat in self.valid_categories:
-                                        self.categories.add(cat)
-                                    else:
-                                        self.errors = True
-                                        self.error_list.append('WARNING: Invalid category "{}" in `{}/{}`'.format(
-                                            cat,
-                                            self.rel_path,
-                                            self.rel_filename,
-                                            ))
-                            elif key == 'license':
-                                # TODO: Honestly, we should probably allow multiple licenses...
-                                if not self.license:
-                                    self.license = val
-                                else:
-                                    self.errors = True
-                                    self.error_list.append('WARNING: More than one license specified in `{}/{}`'.format(
-                                        self.rel_path,
-                                        self.rel_filename,
-                                        ))
-                            elif key == 'license url':
-                                if not self.license_url:
-                                    self.license_url = val
-                                else:
-                                    self.errors = True
-                                    self.error_list.append('WARNING: More than one license URL specified in `{}/{}`'.format(
-                                        self.rel_path,
-                                        self.rel_filename,
-                                        ))
-                            elif key == 'screenshot':
-                                self.screenshots.append(ModURL(val))
-                            elif key == 'video':
-                                self.video_urls.append(ModURL(val))
-                            elif key == 'nexus':
-                                if not self.nexus_link:
-                                    self.nexus_link = ModURL(val)
-                                else:
-                                    self.errors = True
-                                    self.error_list.append('WARNING: More than one nexus URL specified in `{}/{}`'.format(
-                                        self.rel_path,
-                                        self.rel_filename,
-                                        ))
-                            elif key == 'url':
-                                self.urls.append(ModURL(val))
-                            else:
-                                self.errors = True
-                                self.error_list.append('WARNING: Unknown key "{}" in `{}/{}`'.format(
-                                    key,
-                                    self.rel_path,
-                                    self.rel_filename,
-                                    ))
-
-                    # Parse BLIMP tags - https://github.com/apple1417/blcmm-parsing/tree/master/blimp#tag-intepretation
-                    # Honestly, this is hardly any different than our "generic" parsing, above.
-                    elif tag_type == TagType.BLIMP:
-                        if stripped.startswith('@'):
-                            processed_tag = True
-                            parts = stripped[1:].split(' ', 1)
-                            if len(parts) != 2:
-                                self.errors = True
-                                self.error_list.append('WARNING: Bare tag "{}" found in `{}/{}`'.format(
-                                    parts,
-                                    self.rel_path,
-                                    self.rel_filename,
-                                    ))
-                            else:
-                                key, val = stripped[1:].split(' ', 1)
-                                key = key.strip().lower()
-                                val = val.strip()
-                                if key == 'title':
-                                    if not self.mod_title:
-                                        self.mod_title = val
-                                    else:
-                                        self.errors = True
-                                        self.error_list.append('WARNING: More than one mod name specified in `{}/{}`'.format(
-                                            self.rel_path,
-                                            self.rel_filename,
-                                            ))
-                                elif key == 'author':
-                                    self.add_other_author(val)
-                                elif key == 'main-author':
-                                    # Fudging this a bit; we're out of BLIMP spec on account of how we handle
-                                    # these anyway, though, alas.
-                                    self.add_other_author(val)
-                                elif key == 'contact':
-                                    if self.contact is None:
-                                        self.contact = val
-                                    else:
-                                        self.contact = f'{self.contact}, {val}'
-                                elif key == 'contact-email':
-                                    if self.contact_email is None:
-                                        self.contact_email = val
-                                    else:
-                                        self.errors = True
-                                        self.error_list.append('WARNING: More than one email contact specified in `{}/{}`'.format(
-                                            self.rel_path,
-                                            self.rel_filename,
-                                            ))
-                                elif key == 'contact-discord':
-                                    if self.contact_discord is None:
-                                        self.contact_discord = val
-                                    else:
-                                        self.errors = True
-                                        self.error_list.append('WARNING: More than one Discord contact specified in `{}/{}`'.format(
-                                            self.rel_path,
-                                            self.rel_filename,
-                                            ))
-                                elif key == 'version':
-                                    if not self.version:
-                                        self.version = val
-                                    else:
-                                        self.errors = True
-                                        self.error_list.append('WARNING: More than one version specified in `{}/{}`'.format(
-                                            self.rel_path,
-                                            self.rel_filename,
-                                            ))
-                                elif key == 'categories':
-                                    for cat in [c.strip().lower() for c in val.split(',')]:
-                                        if cat in self.valid_categories:
-                                            self.categories.add(cat)
-                                        else:
-                                            self.errors = True
-                                            self.error_list.append('WARNING: Invalid category "{}" in `{}/{}`'.format(
-                                                cat,
-                                                self.rel_path,
-                                                self.rel_filename,
-                                                ))
-                                elif key == 'license':
-                                    # TODO: Honestly, we should probably allow multiple licenses...
-                                    if not self.license:
-                                        self.license = val
-                                    else:
-                                        self.errors = True
-                                        self.error_list.append('WARNING: More than one license specified in `{}/{}`'.format(
-                                            self.rel_path,
-                                            self.rel_filename,
-                                            ))
-                                elif key == 'license-url':
-                                    if not self.license_url:
-                                        self.license_url = val
-                                    else:
-                                        self.errors = True
-                                        self.error_list.append('WARNING: More than one license URL specified in `{}/{}`'.format(
-                                            self.rel_path,
-                                            self.rel_filename,
-                                            ))
-                                elif key == 'screenshot':
-                                    self.screenshots.append(ModURL(val))
-                                elif key == 'video':
-                                    self.video_urls.append(ModURL(val))
-                                elif key == 'homepage':
-                                    if not self.homepage:
-                                        self.homepage = ModURL(val)
-                                    else:
-                                        self.errors = True
-                                        self.error_list.append('WARNING: More than one homepage specified in `{}/{}`'.format(
-                                            self.rel_path,
-                                            self.rel_filename,
-                                            ))
-                                elif key == 'nexus':
-                                    if not self.nexus_link:
-                                        self.nexus_link = ModURL(val)
-                                    else:
-                                        self.errors = True
-                                        self.error_list.append('WARNING: More than one nexus URL specified in `{}/{}`'.format(
-                                            self.rel_path,
-                                            self.rel_filename,
-                                            ))
-                                elif key == 'url':
-                                    self.urls.append(ModURL(val))
-                                elif key == 'pakfile':
-                                    if not self.pakfile:
-                                        self.pakfile = val
-                                    else:
-                                        self.errors = True
-                                        self.error_list.append('WARNING: More than one pakfile specified in `{}/{}`'.format(
-                                            self.rel_path,
-                                            self.rel_filename,
-                                            ))
-                                else:
-                                    self.errors = True
-                                    self.error_list.append('WARNING: Unknown key "{}" in `{}/{}`'.format(
-                                        key,
-                                        self.rel_path,
-                                        self.rel_filename,
-                                        ))
+                    if tag_type is None:
+                        processed_tag = False
+                    else:
+                        processed_tag = ModFile.tag_processors[tag_type](self, stripped)
 
                     if not processed_tag and stripped != '':
                         # Okay, we got something that wasn't a `Key: Value` type thing, so
@@ -1053,6 +1144,134 @@ class ModFile(Cacheable):
         if self.is_pak_only and not self.pakfile:
             raise NotAModFile('No pakfile found on pak-only mod')
 
+    def _process_orig_tag(self, stripped):
+        """
+        Processes a single original-style `Key: Value` tag line.  Returns
+        `True` if the line was a tag, or `False` if not.
+        """
+        # The key is everything up to the first `: `, and the value is
+        # allowed to contain colons itself.
+        (key, sep, val) = stripped.partition(': ')
+        if not sep:
+            return False
+        key = key.strip().lower()
+        handler = ModFile.orig_tag_handlers.get(key)
+        if handler is None:
+            self._tag_warning(f'Unknown key "{key}"')
+        else:
+            handler(self, val.strip())
+        return True
+
+    def _process_blimp_tag(self, stripped):
+        """
+        Processes a single BLIMP-style `@key value` tag line.  Returns
+        `True` if the line was a tag, or `False` if not.  See:
+        https://github.com/apple1417/blcmm-parsing/tree/master/blimp#tag-intepretation
+
+        Honestly, this is hardly any different than our "generic" parsing.
+        """
+        if not stripped.startswith('@'):
+            return False
+        # Splitting on the first single space, so tab-separated values are
+        # still reported as bare tags
+        (key, sep, val) = stripped[1:].partition(' ')
+        if not sep:
+            self._tag_warning(f'Bare tag "@{key}" found')
+            return True
+        key = key.strip().lower()
+        handler = ModFile.blimp_tag_handlers.get(key)
+        if handler is None:
+            self._tag_warning(f'Unknown key "{key}"')
+        else:
+            handler(self, val.strip())
+        return True
+
+    def _tag_warning(self, message):
+        """
+        Flags an error encountered while processing our tags, noting which
+        file it was found in.
+        """
+        self.errors = True
+        self.error_list.append(f'WARNING: {message} in `{self.rel_path}/{self.rel_filename}`')
+
+    def _tag_once(self, attr, label, val):
+        """
+        Sets a tag value which is only allowed to be specified once.
+        """
+        if not getattr(self, attr):
+            setattr(self, attr, val)
+        else:
+            self._tag_warning(f'More than one {label} specified')
+
+    def _tag_categories(self, val):
+        """
+        Adds the given comma-separated list of categories to ourselves.
+        """
+        for cat in ModFile.category_split_re.split(val.lower()):
+            if cat in self.valid_categories:
+                # Store the canonical key object rather than our own copy
+                self.categories.add(self.valid_categories[cat])
+            else:
+                self._tag_warning(f'Invalid category "{cat}"')
+
+    def _tag_blimp_contact(self, val):
+        """
+        BLIMP allows multiple contact tags, so we join them all together.
+        """
+        if self.contact is None:
+            self.contact = val
+        else:
+            self.contact = f'{self.contact}, {val}'
+
+    # Handlers for each known tag key, called with the (stripped) tag value.
+    # Keyed by lowercased tag name so that each tag line only needs a single
+    # dict lookup rather than running through a chain of comparisons.
+    orig_tag_handlers = {
+            'name': lambda self, val: self._tag_once('mod_title', 'mod name', val),
+            'author': lambda self, val: self.add_other_author(val),
+            'contact': lambda self, val: setattr(self, 'contact', val),
+            'contact (email)': lambda self, val: setattr(self, 'contact_email', val),
+            'contact (discord)': lambda self, val: setattr(self, 'contact_discord', val),
+            'version': lambda self, val: self._tag_once('version', 'version', val),
+            'categories': _tag_categories,
+            # TODO: Honestly, we should probably allow multiple licenses...
+            'license': lambda self, val: self._tag_once('license', 'license', val),
+            'license url': lambda self, val: self._tag_once('license_url', 'license URL', val),
+            'screenshot': lambda self, val: self.screenshots.append(ModURL(val)),
+            'video': lambda self, val: self.video_urls.append(ModURL(val)),
+            'nexus': lambda self, val: self._tag_once('nexus_link', 'nexus URL', ModURL(val)),
+            'url': lambda self, val: self.urls.append(ModURL(val)),
+            }
+
+    blimp_tag_handlers = {
+            'title': lambda self, val: self._tag_once('mod_title', 'mod name', val),
+            'author': lambda self, val: self.add_other_author(val),
+            # Fudging this a bit; we're out of BLIMP spec on account of how we handle
+            # these anyway, though, alas.
+            'main-author': lambda self, val: self.add_other_author(val),
+            'contact': _tag_blimp_contact,
+            'contact-email': lambda self, val: self._tag_once('contact_email', 'email contact', val),
+            'contact-discord': lambda self, val: self._tag_once('contact_discord', 'Discord contact', val),
+            'version': lambda self, val: self._tag_once('version', 'version', val),
+            'categories': _tag_categories,
+            # TODO: Honestly, we should probably allow multiple licenses...
+            'license': lambda self, val: self._tag_once('license', 'license', val),
+            'license-url': lambda self, val: self._tag_once('license_url', 'license URL', val),
+            'screenshot': lambda self, val: self.screenshots.append(ModURL(val)),
+            'video': lambda self, val: self.video_urls.append(ModURL(val)),
+            'homepage': lambda self, val: self._tag_once('homepage', 'homepage', ModURL(val)),
+            'nexus': lambda self, val: self._tag_once('nexus_link', 'nexus URL', ModURL(val)),
+            'url': lambda self, val: self.urls.append(ModURL(val)),
+            'pakfile': lambda self, val: self._tag_once('pakfile', 'pakfile', val),
+            }
+
+    # Tag-line processor for each tag type, so the main parsing loop can
+    # dispatch with a single lookup once the type has been detected
+    tag_processors = {
+            TagType.ORIG: _process_orig_tag,
+            TagType.BLIMP: _process_blimp_tag,
+            }
+
     def add_comment_line(self, line):
         """
         Adds a comment line to our description, attempting to strip out some common
@@ -1063,12 +1282,9 @@ class ModFile(Cacheable):
         # (this should already be done)
         #line = comment_line.strip("/#\n\r\t ")
         
-        # Prevent adding an empty line at the beginning
-        if line == '' and len(self.mod_desc) == 0:
-            return
-
-        # Prevent adding more than one empty line in a row
-        if len(self.mod_desc) > 0 and self.mod_desc[-1] == '' and line == '':
+        # Prevent adding an empty line at the beginning, or more than one
+        # empty line in a row
+        if line == '' and (not self.mod_desc or self.mod_desc[-1] == ''):
             return
 
         # Attempt to prevent adding in header ASCII art
@@ -1083,18 +1299,15 @@ class ModFile(Cacheable):
         """
         Sort by mod title
         """
-        return self.mod_title.lower() < other.mod_title.lower()
+        return self.mod_title_lower < other.mod_title_lower
 
     def wiki_filename(self):
-        global wiki_filename
         return wiki_filename(self.wiki_filename_base)
 
     def wiki_link_html(self):
-        global wiki_link_html
         return wiki_link_html(self.mod_title_display, self.wiki_filename_base)
 
     def wiki_link(self):
-        global wiki_link
         return wiki_link(self.mod_title_display, self.wiki_filename_base)
 
     def rel_url(self):
@@ -1168,9 +1381,13 @@ class ModFile(Cacheable):
     def related_links_sorted(self):
         """
         Returns a sorted version of our related links; used to ensure that
-        the mod pages have entirely predictable output.
+        the mod pages have entirely predictable output.  This gets called
+        for serializing and rendering both, so we hang on to the result
+        until our links change.  Don't modify the returned list!
         """
-        return sorted(self.related_links)
+        if self._related_links_sorted is None:
+            self._related_links_sorted = sorted(self.related_links)
+        return self._related_links_sorted
 
 class Readme(Cacheable):
     """
@@ -1180,12 +1397,29 @@ class Readme(Cacheable):
     well whether it's markdown or plaintext.
     """
 
+    __slots__ = ('mapping', 'first_section', 'filename', 'rel_filename', 'mod_count')
+
     cache_key = 'readmes'
 
+    # Classifies a (stripped) README line.  `underline` is for multiline
+    # markdown section highlighting -- the line has to consist entirely of
+    # at least three `=` or `-` chars to count.
+    line_re = re.compile(r'(?P<hash>#.*)|(?P<underline>={3,}|-{3,})|(?P<dash>-.*)|(?P<text>.*)', re.DOTALL)
+
+    # First characters which could make a line something other than text
+    line_markers = frozenset(('#', '=', '-'))
+
+    # How similar a section name has to be to a mod name (as a Levenshtein
+    # ratio) for us to consider it that mod's section
+    section_match_ratio = .8
+
     def __init__(self, mtime, dirinfo=None, filename=None, initial_status=Cacheable.S_UNKNOWN):
         super().__init__(mtime, initial_status)
         self.mapping = {'(default)': []}
         self.first_section = None
+        # The number of mods in our dir, the last time we were matched
+        # against them
+        self.mod_count = None
         if filename:
             full_filename = dirinfo[filename]
             self.read_file(full_filename)
@@ -1203,11 +1437,14 @@ class Readme(Cacheable):
         containing multiple mods
         """
         mod_name_lower = mod_name.lower()
+        # Passing the cutoff in lets Levenshtein bail out early on sections
+        # which can't possibly match.
+        cutoff = Readme.section_match_ratio
         if single_mod:
             if 'overview' in self.mapping:
                 return self.mapping['overview']
             for section in self.mapping.keys():
-                if Levenshtein.ratio(mod_name_lower, section) > .8:
+                if Levenshtein.ratio(mod_name_lower, section, score_cutoff=cutoff) > cutoff:
                     return self.mapping[section]
             if self.first_section:
                 return self.mapping[self.first_section]
@@ -1215,7 +1452,7 @@ class Readme(Cacheable):
                 return self.mapping['(default)']
         else:
             for section in self.mapping.keys():
-                if Levenshtein.ratio(mod_name_lower, section) > .8:
+                if Levenshtein.ratio(mod_name_lower, section, score_cutoff=cutoff) > cutoff:
                     return self.mapping[section]
             # New for the BL3 modcabinet, since I've got multiple variants of
             # the same mod alongside a single README: I'm gonna default to
@@ -1236,8 +1473,10 @@ class Readme(Cacheable):
                 'f': self.filename,
                 'r': self.rel_filename,
                 'm': self.mtime,
+                'ch': self.content_hash,
                 'd': self.mapping,
                 's': self.first_section,
+                'mc': self.mod_count,
                 }
 
     def _unserialize(self, input_dict):
@@ -1248,6 +1487,11 @@ class Readme(Cacheable):
         self.rel_filename = input_dict['r']
         self.mapping = input_dict['d']
         self.first_section = input_dict['s']
+        # Mod count added 2026-10-16
+        if 'mc' in input_dict:
+            self.mod_count = input_dict['mc']
+        else:
+            self.mod_count = None
 
     def read_file(self, filename):
         """
@@ -1270,12 +1514,23 @@ class Readme(Cacheable):
         """
         prev_line = None
         cur_section = '(default)'
-        for line in df.readlines():
+        # Local lookups, since these get hit for every line
+        line_markers = Readme.line_markers
+        classify = Readme.line_re.fullmatch
+        # Just iterating the file, rather than using splitlines(), which
+        # would also split on things like form feeds.
+        for line in df:
             line = line.strip()
-            if line.startswith('#'):
+            # Most lines are just text, so don't bother with the regex
+            # unless the first char could make it something else.
+            if line[:1] in line_markers:
+                line_type = classify(line).lastgroup
+            else:
+                line_type = 'text'
+            if line_type == 'hash':
                 cur_section = line.lstrip("# \t").lower()
                 self.mapping[cur_section] = []
-            elif line.startswith('==='):
+            elif line_type == 'underline':
                 # Multiline markdown section highlighting.  Annoying!  A
                 # shame I personally use it all the time, eh?
                 if prev_line:
@@ -1289,21 +1544,7 @@ class Readme(Cacheable):
                     if not self.first_section:
                         self.first_section = cur_section
                     self.mapping[cur_section].append(line)
-            elif line.startswith('---'):
-                # Multiline markdown section highlighting.  Annoying!  A
-                # shame I personally use it all the time, eh?
-                if prev_line:
-                    if len(self.mapping[cur_section]) > 0:
-                        self.mapping[cur_section].pop()
-                        if self.first_section == cur_section and len(self.mapping[cur_section]) == 0:
-                            self.first_section = None
-                        cur_section = prev_line.strip().lower()
-                        self.mapping[cur_section] = []
-                else:
-                    if not self.first_section:
-                        self.first_section = cur_section
-                    self.mapping[cur_section].append(line)
-            elif line.startswith('-'):
+            elif line_type == 'dash':
                 cur_section = line.lstrip("- \t").lower()
                 self.mapping[cur_section] = []
             else:
@@ -1318,6 +1559,22 @@ class Readme(Cacheable):
             while len(data) > 0 and data[-1] == '':
                 data.pop()
 
+def _construct_cacheable(cache_class, args, use_error_list, extra):
+    """
+    Worker function for `FileCache.load_many()`, which constructs a single
+    `cache_class` object given the constructor `args`.  This needs to live at
+    the module level so that it can be sent to a process pool.  Returns a
+    tuple with the new object (or `None` if it turned out not to be a mod
+    file) and the list of errors encountered while loading it.
+    """
+    errors = []
+    if use_error_list:
+        extra = dict(extra, error_list=errors)
+    try:
+        return (cache_class(*args, **extra), errors)
+    except NotAModFile:
+        return (None, errors)
+
 class FileCache(object):
     """
     Base caching class which we'll use for both mod files and READMEs.
@@ -1327,36 +1584,46 @@ class FileCache(object):
 
     cache_version = 1
 
-    def __init__(self, cache_class, filename, do_load=True):
+    def __init__(self, cache_class, filename, do_load=True, compress=True):
         """
         Initialize a FileCache using the given `cache_class` and `filename`.
         `cache_class` should be a `Cacheable` object, or at least one which
         pretends to be.  If `do_load` is `False`, we will not actually
         attempt to read anything from the cache, instead pretending that
-        we have a totally clean slate.
+        we have a totally clean slate.  If `compress` is `False`, we'll
+        save ourselves out as plain JSON.  (Either kind of file can be
+        loaded regardless.)
         """
         self.cache_class = cache_class
         self.filename = filename
+        self.compress = compress
         self.mapping = {}
+        # Whether or not we need to write ourselves back out to disk.  Changes
+        # to the objects we hold are detected via their statuses at save time;
+        # this only needs to track changes to the mapping itself.
+        self.dirty = True
         if do_load and os.path.exists(filename):
-            with lzma.open(filename, 'rt', encoding='utf-8') as df:
-                serialized_dict = json.load(df)
-                if serialized_dict['version'] > self.cache_version:
-                    raise Exception('{} is a version {} cache.  We only support up to version {}'.format(
-                        filename, serialized_dict['version'], self.cache_version,
-                        ))
-                for (inner_filename, inner_dict) in serialized_dict[self.cache_class.cache_key].items():
-                    self.mapping[inner_filename] = self.cache_class.unserialize(self.cache_class, inner_dict)
+            self.dirty = False
+            serialized_dict = cache_loads(cache_read(filename))
+            if serialized_dict['version'] > self.cache_version:
+                raise Exception('{} is a version {} cache.  We only support up to version {}'.format(
+                    filename, serialized_dict['version'], self.cache_version,
+                    ))
+            for (inner_filename, inner_dict) in serialized_dict[self.cache_class.cache_key].items():
+                self.mapping[inner_filename] = self.cache_class.unserialize(self.cache_class, inner_dict)
 
     def save(self):
         """
-        Saves ourself
+        Saves ourself, so long as something has actually changed since we
+        were loaded.  Compressing the cache is the most expensive part of
+        saving, and on most runs nearly every entry is unchanged.
         """
+        if not self.dirty and all(obj.status == Cacheable.S_CACHED for obj in self.mapping.values()):
+            return
         save_dict = {'version': self.cache_version, self.cache_class.cache_key: {}}
         for mod_filename, mod in self.mapping.items():
             save_dict[self.cache_class.cache_key][mod_filename] = mod.serialize()
-        with lzma.open(self.filename, 'wt', encoding='utf-8') as df:
-            json.dump(save_dict, df)
+        cache_write(self.filename, cache_dumps(save_dict), self.compress)
 
     def load(self, dirinfo, filename, **extra):
         """
@@ -1365,17 +1632,90 @@ class FileCache(object):
         return our previously-cached version.  Extra dict arguments, if specified,
         will be passed in to the constructor.
         """
-        full_filename = dirinfo[filename]
-        mtime = os.stat(full_filename).st_mtime
-        if full_filename not in self.mapping or mtime != self.mapping[full_filename].mtime:
-            if full_filename not in self.mapping:
-                initial_status = Cacheable.S_NEW
-            else:
-                initial_status = Cacheable.S_UPDATED
+        (full_filename, mtime, initial_status, file_hash) = self._check_file(dirinfo, filename)
+        if initial_status is not None:
             # This might throw a NotAModFile exception, btw...
-            self.mapping[full_filename] = self.cache_class(mtime, dirinfo, filename, initial_status, **extra)
+            obj = self.cache_class(mtime, dirinfo, filename, initial_status, **extra)
+            obj.content_hash = file_hash
+            if full_filename in self.mapping:
+                obj.carry_over(self.mapping[full_filename])
+            self.mapping[full_filename] = obj
+            self.dirty = True
         return self.mapping[full_filename]
 
+    def load_many(self, executor, to_load, error_list=None, **extra):
+        """
+        Loads a whole list of `(dirinfo, filename)` tuples, as with `load()`,
+        but farms out the actual parsing of any new or changed files to the
+        given `concurrent.futures` `executor`.  Returns a dict mapping full
+        filenames to their loaded objects.  Files which raise `NotAModFile`
+        are left out of the returned dict.
+
+        If `error_list` is specified, it will be passed in to the constructor
+        as with the other `extra` arguments, but since objects constructed in
+        another process can't append to our own list, each one gets its own
+        list whose contents are copied back into `error_list` afterwards (in
+        the same order as `to_load`).
+        """
+        loaded = {}
+        to_parse = []
+        for (dirinfo, filename) in to_load:
+            (full_filename, mtime, initial_status, file_hash) = self._check_file(dirinfo, filename)
+            if initial_status is None:
+                loaded[full_filename] = self.mapping[full_filename]
+            else:
+                to_parse.append((full_filename, file_hash, (mtime, dirinfo, filename, initial_status)))
+
+        results = executor.map(_construct_cacheable,
+                [self.cache_class]*len(to_parse),
+                [args for (_, _, args) in to_parse],
+                [error_list is not None]*len(to_parse),
+                [extra]*len(to_parse),
+                chunksize=16,
+                )
+        for ((full_filename, file_hash, _), (obj, obj_errors)) in zip(to_parse, results):
+            if error_list is not None:
+                error_list.extend(obj_errors)
+            if obj is not None:
+                obj.content_hash = file_hash
+                if error_list is not None:
+                    obj.error_list = error_list
+                obj.reattach(**extra)
+                if full_filename in self.mapping:
+                    obj.carry_over(self.mapping[full_filename])
+                self.mapping[full_filename] = obj
+                self.dirty = True
+                loaded[full_filename] = obj
+
+        return loaded
+
+    def _check_file(self, dirinfo, filename):
+        """
+        Checks the given `filename` (using `dirinfo` as its base) against our
+        cache.  Returns a tuple containing the full filename, its mtime, the
+        status which a newly-constructed object should have, and the hash of
+        the file's contents.  That status will be `None` if our cached version
+        is still current.
+
+        A matching mtime is trusted without reading the file at all.  If the
+        mtime differs, we hash the file and only report it as updated if the
+        contents have actually changed -- otherwise we just take note of the
+        new mtime and keep using the cached object.
+        """
+        full_filename = dirinfo[filename]
+        mtime = dirinfo.get_mtime(filename)
+        if full_filename not in self.mapping:
+            return (full_filename, mtime, Cacheable.S_NEW, content_hash(full_filename))
+        cached = self.mapping[full_filename]
+        if mtime == cached.mtime:
+            return (full_filename, mtime, None, cached.content_hash)
+        file_hash = content_hash(full_filename)
+        if cached.content_hash is not None and file_hash == cached.content_hash:
+            cached.set_mtime(mtime)
+            self.dirty = True
+            return (full_filename, mtime, None, file_hash)
+        return (full_filename, mtime, Cacheable.S_UPDATED, file_hash)
+
     def items(self):
         """
         Convenience function to be able to use this sort of like a dict
@@ -1399,6 +1739,7 @@ class FileCache(object):
         Convenience function to be able to use this sort of like a dict
         """
         self.mapping[key] = value
+        self.dirty = True
 
     def __getitem__(self, key):
         """
@@ -1417,6 +1758,7 @@ class FileCache(object):
         Convenience function to be able to use this sort of like a dict
         """
         del self.mapping[key]
+        self.dirty = True
 
     def __len__(self):
         """
@@ -1494,6 +1836,8 @@ class Category(object):
     linking functions, really.
     """
 
+    __slots__ = ('full_title', 'prefix', 'title', '_wiki_filename')
+
     def __init__(self, title):
         self.full_title = title
         if ': ' in title:
@@ -1501,17 +1845,15 @@ class Category(object):
         else:
             self.prefix = None
             self.title = title
+        self._wiki_filename = wiki_filename(self.full_title)
 
     def wiki_filename(self):
-        global wiki_filename
-        return wiki_filename(self.full_title)
+        return self._wiki_filename
 
     def wiki_link(self):
-        global wiki_link_html
         return wiki_link_html(self.title, self.full_title)
 
     def wiki_link_abbrev(self):
-        global wiki_link
         return wiki_link(self.title, self.full_title)
 
     def __lt__(self, other):
@@ -1523,16 +1865,17 @@ class Game(object):
     glorified dict.
     """
 
+    __slots__ = ('abbreviation', 'title', '_wiki_filename')
+
     def __init__(self, abbreviation, title):
         self.abbreviation = abbreviation
         self.title = title
+        self._wiki_filename = wiki_filename(self.title)
 
     def wiki_filename(self):
-        global wiki_filename
-        return wiki_filename(self.title)
+        return self._wiki_filename
 
     def wiki_link_back(self):
-        global wiki_link
         return wiki_link('← Go Back', self.title)
 
 class App(object):
@@ -1541,98 +1884,111 @@ class App(object):
     """
 
     # Valid Categories
-    categories = collections.OrderedDict([
+    categories = {
 
         # Major Modpacks
-        ('major-pack', Category('Major Overhauls and Mod Packs')),
+        'major-pack': Category('Major Overhauls and Mod Packs'),
 
         # General Gameplay and Balance
-        ('mode-balance', Category('General Gameplay and Balance: Game Mode Balance')),
-        ('scaling', Category('General Gameplay and Balance: Scaling Changes')),
-        ('mayhem', Category('General Gameplay and Balance: Mayhem Mode Changes')),
-        ('element', Category('General Gameplay and Balance: Elements and Damage Types')),
-        ('quest-changes', Category('General Gameplay and Balance: Quest Changes')),
-        ('economy', Category('General Gameplay and Balance: Economy Changes')),
-        ('gameplay', Category('General Gameplay and Balance: Other Gameplay Changes')),
-        ('randomizer', Category('General Gameplay and Balance: Randomizers')),
+        'mode-balance': Category('General Gameplay and Balance: Game Mode Balance'),
+        'scaling': Category('General Gameplay and Balance: Scaling Changes'),
+        'mayhem': Category('General Gameplay and Balance: Mayhem Mode Changes'),
+        'element': Category('General Gameplay and Balance: Elements and Damage Types'),
+        'quest-changes': Category('General Gameplay and Balance: Quest Changes'),
+        'economy': Category('General Gameplay and Balance: Economy Changes'),
+        'gameplay': Category('General Gameplay and Balance: Other Gameplay Changes'),
+        'randomizer': Category('General Gameplay and Balance: Randomizers'),
 
         # Activities
-        ('trials', Category('Activities: Trials / Proving Grounds')),
-        ('slaughters', Category('Activities: Slaughters')),
-        ('takedowns', Category('Activities: Takedowns')),
-        ('event', Category('Activities: Seasonal Events')),
-        ('armsrace', Category('Activities: Arms Race')),
+        'trials': Category('Activities: Trials / Proving Grounds'),
+        'slaughters': Category('Activities: Slaughters'),
+        'takedowns': Category('Activities: Takedowns'),
+        'event': Category('Activities: Seasonal Events'),
+        'armsrace': Category('Activities: Arms Race'),
 
         # Characters and Skills
-        ('char-overhaul', Category('Characters and Skills: Full Character Overhauls')),
-        ('skill-system', Category('Characters and Skills: Skill System Changes')),
-        ('char-beastmaster', Category('Characters and Skills: Beastmaster Changes')),
-        ('char-gunner', Category('Characters and Skills: Gunner Changes')),
-        ('char-operative', Category('Characters and Skills: Operative Changes')),
-        ('char-siren', Category('Characters and Skills: Siren Changes')),
-        ('char-other', Category('Characters and Skills: Other Character Changes')),
+        'char-overhaul': Category('Characters and Skills: Full Character Overhauls'),
+        'skill-system': Category('Characters and Skills: Skill System Changes'),
+        'char-beastmaster': Category('Characters and Skills: Beastmaster Changes'),
+        'char-gunner': Category('Characters and Skills: Gunner Changes'),
+        'char-operative': Category('Characters and Skills: Operative Changes'),
+        'char-siren': Category('Characters and Skills: Siren Changes'),
+        'char-other': Category('Characters and Skills: Other Character Changes'),
 
         # Weapons/Gear
-        ('gear-general', Category('Weapons/Gear: General')),
-		('gear-anointments', Category('Weapons/Gear: Anointments')),
-        ('gear-brand', Category('Weapons/Gear: Brand Overhauls')),
-        ('gear-pack', Category('Weapons/Gear: Packs')),
-        ('gear-ar', Category('Weapons/Gear: Assault Rifles')),
-        ('gear-pistol', Category('Weapons/Gear: Pistols')),
-        ('gear-heavy', Category('Weapons/Gear: Heavy Weapons')),
-        ('gear-shotgun', Category('Weapons/Gear: Shotguns')),
-        ('gear-smg', Category('Weapons/Gear: SMGs')),
-        ('gear-sniper', Category('Weapons/Gear: Sniper Rifles')),
-        ('gear-grenade', Category('Weapons/Gear: Grenade Mods')),
-        ('gear-com', Category('Weapons/Gear: COMs')),
-        ('gear-shield', Category('Weapons/Gear: Shields')),
-        ('gear-artifact', Category('Weapons/Gear: Artifacts')),
+        'gear-general': Category('Weapons/Gear: General'),
+        'gear-anointments': Category('Weapons/Gear: Anointments'),
+        'gear-brand': Category('Weapons/Gear: Brand Overhauls'),
+        'gear-pack': Category('Weapons/Gear: Packs'),
+        'gear-ar': Category('Weapons/Gear: Assault Rifles'),
+        'gear-pistol': Category('Weapons/Gear: Pistols'),
+        'gear-heavy': Category('Weapons/Gear: Heavy Weapons'),
+        'gear-shotgun': Category('Weapons/Gear: Shotguns'),
+        'gear-smg': Category('Weapons/Gear: SMGs'),
+        'gear-sniper': Category('Weapons/Gear: Sniper Rifles'),
+        'gear-grenade': Category('Weapons/Gear: Grenade Mods'),
+        'gear-com': Category('Weapons/Gear: COMs'),
+        'gear-shield': Category('Weapons/Gear: Shields'),
+        'gear-artifact': Category('Weapons/Gear: Artifacts'),
 
         # Farming and Looting
-        ('loot-system', Category('Farming and Looting: Loot System Overhauls')),
-        ('enemy-drops', Category('Farming and Looting: Enemy Drop Changes')),
-        ('chests', Category('Farming and Looting: Chest and Container Changes')),
-        ('vendor', Category('Farming and Looting: Vending Machines')),
-        ('slots', Category('Farming and Looting: Slot Machines')),
-        ('quest-rewards', Category('Farming and Looting: Quest Rewards')),
-        ('loot-sources', Category('Farming and Looting: Other Loot Sources')),
+        'loot-system': Category('Farming and Looting: Loot System Overhauls'),
+        'enemy-drops': Category('Farming and Looting: Enemy Drop Changes'),
+        'chests': Category('Farming and Looting: Chest and Container Changes'),
+        'vendor': Category('Farming and Looting: Vending Machines'),
+        'slots': Category('Farming and Looting: Slot Machines'),
+        'quest-rewards': Category('Farming and Looting: Quest Rewards'),
+        'loot-sources': Category('Farming and Looting: Other Loot Sources'),
 
         # Enemies
-        ('spawns', Category('Enemies: Enemy Spawns')),
-        ('enemy', Category('Enemies: Enemy Changes')),
+        'spawns': Category('Enemies: Enemy Spawns'),
+        'enemy': Category('Enemies: Enemy Changes'),
 
         # Maps and Public Transport
-        ('vehicle', Category('Maps and Public Transport: Vehicles')),
-        ('fast-travel', Category('Maps and Public Transport: Fast Travel')),
-        ('maps', Category('Maps and Public Transport: Map Alterations')),
+        'vehicle': Category('Maps and Public Transport: Vehicles'),
+        'fast-travel': Category('Maps and Public Transport: Fast Travel'),
+        'maps': Category('Maps and Public Transport: Map Alterations'),
 
         # Audio and Visual
-        ('av', Category('Audio and Visual: General A/V Settings')),
-        ('ui', Category('Audio and Visual: UI Changes')),
-        ('av-gear', Category('Audio and Visual: Weapon and Gear Visuals')),
-        ('av-char', Category('Audio and Visual: Character Visuals')),
-        ('av-enemy', Category('Audio and Visual: Enemy Visuals')),
-        ('audio', Category('Audio and Visual: Audio Changes')),
-        ('text', Category('Audio and Visual: Text Changes')),
+        'av': Category('Audio and Visual: General A/V Settings'),
+        'ui': Category('Audio and Visual: UI Changes'),
+        'av-gear': Category('Audio and Visual: Weapon and Gear Visuals'),
+        'av-char': Category('Audio and Visual: Character Visuals'),
+        'av-enemy': Category('Audio and Visual: Enemy Visuals'),
+        'audio': Category('Audio and Visual: Audio Changes'),
+        'text': Category('Audio and Visual: Text Changes'),
 
         # Quality of Life
-        ('qol', Category('Quality of Life: General QoL')),
-        ('qol-ui', Category('Quality of Life: UI QoL Changes')),
-        ('inventory', Category('Quality of Life: Inventory/Bank Changes')),
+        'qol': Category('Quality of Life: General QoL'),
+        'qol-ui': Category('Quality of Life: UI QoL Changes'),
+        'inventory': Category('Quality of Life: Inventory/Bank Changes'),
 
         # Other
-        ('bugfix', Category('Other: Bugfixes')),
-        ('cheat', Category('Other: Cheat Mods')),
-        ('modpack', Category('Other: Mod Packs')),
-        ('translation', Category('Other: Translations')),
-        ('translation-fr', Category('Other: Translations (French)')),
-        ('joke', Category('Other: Joke Mods')),
-        ('resource', Category('Other: Resource Mods')),
+        'bugfix': Category('Other: Bugfixes'),
+        'cheat': Category('Other: Cheat Mods'),
+        'modpack': Category('Other: Mod Packs'),
+        'translation': Category('Other: Translations'),
+        'translation-fr': Category('Other: Translations (French)'),
+        'joke': Category('Other: Joke Mods'),
+        'resource': Category('Other: Resource Mods'),
+
+        }
 
-        ])
+    # File extensions which we'll consider to be mods
+    mod_extensions = ('bl3hotfix', 'bl3hotfix.gz', 'bl3pakinfo')
 
     def __init__(self, ini_file):
 
+        # Mod files look their categories up in here, mapping each key to
+        # itself, so that every mod stores our own key objects rather than
+        # equal copies.  This used to be a frozenset, for quick membership
+        # checks; a dict's membership checks are every bit as quick, so the
+        # one table now handles both the check and the canonical-key lookup.
+        # The keys are interned as well, so that categories read back out of
+        # the cache (which get interned) end up as the very same objects.
+        self.categories = {sys.intern(key): cat for (key, cat) in self.categories.items()}
+        self.valid_categories = {key: key for key in self.categories}
+
         # Read config values from the INI file
         self.config = configparser.ConfigParser()
         if isinstance(ini_file, str):
@@ -1648,6 +2004,7 @@ class App(object):
         self.readme_cache_filename = os.path.join(self.cache_dir, 'readmecache.json.xz')
         self.author_cache_filename = os.path.join(self.cache_dir, 'authorcache.json.xz')
         self.templatemtime_cache_filename = os.path.join(self.cache_dir, 'templatemtime.json.xz')
+        self.page_cache_filename = os.path.join(self.cache_dir, 'pagecache.json.xz')
         self.log_dir = self.config['logging']['log_dir']
         self.log_file = os.path.join(self.log_dir, 'bl3cabinetsorter.log')
         self.default_log_level = self.config['logging']['default_level']
@@ -1668,7 +2025,9 @@ class App(object):
         self.console.setLevel(getattr(logging, self.default_log_level))
         self.logger.addHandler(self.console)
 
-        # Grab Jinja templates
+        # Grab Jinja templates (and stat the whole dir in one go, for
+        # the mtime checks we do on some of them)
+        self.template_dirinfo = TemplateDirInfo('templates')
         jinja_env = jinja2.Environment(loader=jinja2.FileSystemLoader('templates'))
         self.home_template = jinja_env.get_template('home.md')
         self.game_template = jinja_env.get_template('game.md')
@@ -1708,17 +2067,15 @@ class App(object):
         self.readme_cache = FileCache(Readme, self.readme_cache_filename, do_load=load_cache)
         self.author_cache = FileCache(Author, self.author_cache_filename, do_load=load_cache)
         self.templatemtime_cache = FileCache(TemplateMTime, self.templatemtime_cache_filename, do_load=load_cache)
+        self.page_cache = FileCache(WikiPage, self.page_cache_filename, do_load=load_cache)
         self.error_list = []
 
         # Initialize templatemtime_cache.  We don't have to do this for
         # most of our templates because they get generated every time,
         # but we want it for mods and authors since those otherwise only
-        # get generated if other caches have noticed changes.  We're fudging
-        # some DirInfo stuff a bit, since that class is built with a BLCM
-        # repo in mind.
-        temp_info = DirInfo('', 'templates', ['mod.md', 'author.md'])
-        self.mod_template_mtime = self.templatemtime_cache.load(temp_info, 'mod.md')
-        self.author_template_mtime = self.templatemtime_cache.load(temp_info, 'author.md')
+        # get generated if other caches have noticed changes.
+        self.mod_template_mtime = self.templatemtime_cache.load(self.template_dirinfo, 'mod.md')
+        self.author_template_mtime = self.templatemtime_cache.load(self.template_dirinfo, 'author.md')
 
         # Continue
         try:
@@ -1747,8 +2104,6 @@ class App(object):
         Actual function to do most of the work.
         """
 
-        global wiki_link_html
-
         # If we've been told to do initial tasks, do those first
         if do_initial_tasks:
             self.logger.info('Performing initial setup tasks.  This may take awhile')
@@ -1782,30 +2137,35 @@ class App(object):
         category_filename = 'Mod-Categories.md'
         authors_filename = 'Authors.md'
         all_mods_filename = 'All-Mods.md'
-        reserved_pages = set([home_filename, status_filename, sidebar_filename, category_filename, authors_filename, all_mods_filename])
-        created_pages = set([home_filename, status_filename, sidebar_filename, category_filename, authors_filename, all_mods_filename])
+        game_filename = 'Borderlands 3 Mods.md'
+        core_pages = [home_filename, status_filename, sidebar_filename, category_filename, authors_filename, all_mods_filename]
+        created_pages = set(core_pages)
 
-        # Anything in our static_pages dir should be reserved
+        # Read in our static pages
         self.logger.debug('Reading in static pages')
         static_pages = {}
         for filename in os.listdir('static_pages'):
             full_filename = os.path.join('static_pages', filename)
-            reserved_pages.add(filename)
             with open(full_filename) as df:
                 static_pages[filename] = df.read()
 
-        # Add all game/category pages to our reserved_pages list
-        reserved_pages.add('Borderlands 3 Mods.md')
-        for cat in self.categories.values():
-            reserved_pages.add(cat.wiki_filename())
+        # Our core pages, static pages, and all game/category pages are
+        # reserved.  None of these change during the run.
+        reserved_pages = frozenset(itertools.chain(
+            core_pages,
+            static_pages.keys(),
+            [game_filename],
+            (cat.wiki_filename() for cat in self.categories.values()),
+            ))
 
         # Pull down the latest repo
         if do_git:
             self.logger.debug('Pulling mods repo from git')
-            modsrepo = git.Repo(self.repo_dir)
-            before_hash = modsrepo.head.object.hexsha
-            modsrepo.git.pull()
-            after_hash = modsrepo.head.object.hexsha
+            # We don't need a full Repo object just to see if HEAD moved
+            modsgit = git.Git(self.repo_dir)
+            before_hash = modsgit.rev_parse('HEAD')
+            modsgit.pull('--ff-only')
+            after_hash = modsgit.rev_parse('HEAD')
             if before_hash == after_hash:
                 if force_run:
                     self.logger.info('No update found for mods repo, continuing anyway')
@@ -1819,34 +2179,53 @@ class App(object):
 
         # Loop through our game dirs
         self.logger.debug('Beginning walkthrough of repo directory')
+        # `name_resolution` is keyed by (title, author, filename), all
+        # lowercase except for the filename.  `author_count` tracks how many
+        # different authors have a mod with the same title, and `file_count`
+        # how many files a single author has with the same title.
         name_resolution = {}
+        author_count = collections.Counter()
+        file_count = collections.Counter()
 
+        # First collect all the mod files we might want to look at
         game_dir = self.repo_dir
-        for (dirpath, dirnames, filenames) in os.walk(game_dir):
+        dir_mod_files = []
+        for (dirpath, filenames) in self._scan(game_dir):
 
             # Make a mapping of files by lower-case, so that we can
             # match case-insensitively
             dirinfo = DirInfo(self.repo_dir, dirpath, filenames)
 
+            mod_files = []
+            for mod_file in dirinfo.get_all_with_exts(self.mod_extensions):
+                if 'readme' not in mod_file.lower():
+                    mod_files.append(mod_file)
+            dir_mod_files.append((dirinfo, mod_files))
+
+        # Then load them all in.  Parsing is CPU-bound and each file is
+        # independent, so any new or changed files get parsed in parallel.
+        # Files which turn out not to be mods won't be in `loaded_mods`.
+        with concurrent.futures.ProcessPoolExecutor() as executor:
+            loaded_mods = self.mod_cache.load_many(executor,
+                    [(dirinfo, mod_file) for (dirinfo, mod_files) in dir_mod_files for mod_file in mod_files],
+                    error_list=self.error_list,
+                    valid_categories=self.valid_categories,
+                    )
+
+        # Now process each dir
+        for (dirinfo, mod_files) in dir_mod_files:
+
             # Load in readme info, if we can.
             readme = None
             if dirinfo.readme:
                 readme = self.readme_cache.load(dirinfo, dirinfo.readme)
 
-            # Loop through the mods found in the dir and load 'em, if we can
+            # Grab the mods found in the dir which we were able to load
             processed_files = []
-            for mod_file in dirinfo.get_all_with_ext('bl3hotfix') \
-                    + dirinfo.get_all_with_ext('bl3hotfix.gz') \
-                    + dirinfo.get_all_with_ext('bl3pakinfo'):
-                if 'readme' not in mod_file.lower():
-                    try:
-                        processed_files.append(self.mod_cache.load(dirinfo, mod_file,
-                            error_list=self.error_list,
-                            valid_categories=self.categories,
-                            ))
-                    except NotAModFile:
-                        # Whatever, if we're processing *.txt we're bound to have this pop up.
-                        pass
+            for mod_file in mod_files:
+                full_filename = dirinfo[mod_file]
+                if full_filename in loaded_mods:
+                    processed_files.append(loaded_mods[full_filename])
 
             # If we only processed a single mod, then it's a single-mod dir
             if len(processed_files) == 1:
@@ -1854,37 +2233,53 @@ class App(object):
             else:
                 single_mod = False
 
+            # If neither the README nor any of the mods in here have changed
+            # since last time, matching them up again would just give us the
+            # data we've already got, so we can skip it.
+            if (readme
+                    and readme.status == Readme.S_CACHED
+                    and readme.mod_count == len(processed_files)
+                    and all(f.status == ModFile.S_CACHED for f in processed_files)):
+                readme_unchanged = True
+            else:
+                readme_unchanged = False
+                if readme and readme.mod_count != len(processed_files):
+                    readme.mod_count = len(processed_files)
+                    self.readme_cache.dirty = True
+
             # Do Stuff with each file we got
             for processed_file in processed_files:
 
                 # See if we've got a "better" description in a readme
-                if readme:
-                    readme_info = readme.find_matching(processed_file.mod_title, single_mod)
-                    changelog = readme.find_matching('changelog', False)
+                if readme_unchanged:
+                    processed_file.seen = True
                 else:
-                    readme_info = []
-                    changelog = []
-                processed_file.update_readme_desc(readme, readme_info)
-                processed_file.update_changelog(changelog)
+                    if readme:
+                        readme_info = readme.find_matching(processed_file.mod_title, single_mod)
+                        changelog = readme.find_matching('changelog', False)
+                    else:
+                        readme_info = []
+                        changelog = []
+                    processed_file.update_readme_desc(readme, readme_info)
+                    processed_file.update_changelog(changelog)
 
                 # Make sure that `seen_cats` is up to date
                 for cat in processed_file.categories:
-                    if cat not in seen_cats:
-                        seen_cats[cat] = []
-                    seen_cats[cat].append(processed_file)
+                    seen_cats.setdefault(cat, []).append(processed_file)
 
                 # Previously we were adding mods to our author cache here, but we need
                 # to wait until we resolve any potential mod name conflicts first, so
                 # that's now happening later...
 
                 # Add to our name_resolution object for later processing
-                title_lower = processed_file.mod_title.lower()
-                if title_lower not in name_resolution:
-                    name_resolution[title_lower] = {}
-                author_lower = processed_file.mod_author.lower()
-                if author_lower not in name_resolution[title_lower]:
-                    name_resolution[title_lower][author_lower] = {}
-                name_resolution[title_lower][author_lower][processed_file.rel_filename] = processed_file.full_filename
+                title_lower = processed_file.mod_title_lower
+                author_lower = processed_file.mod_author_lower
+                key = (title_lower, author_lower, processed_file.rel_filename)
+                if key not in name_resolution:
+                    if file_count[(title_lower, author_lower)] == 0:
+                        author_count[title_lower] += 1
+                    file_count[(title_lower, author_lower)] += 1
+                name_resolution[key] = processed_file.full_filename
 
         # Report that we're done
         self.logger.debug('Finished looping through mods directory')
@@ -1944,59 +2339,58 @@ class App(object):
         # boundaries.  Note that this needs to happen *before* any categories or
         # author pages are written out.
         self.logger.debug('Resolving mod name conflicts')
-        for (mod_title, mod_authors) in name_resolution.items():
-            shared_set = set()
-            need_author = (len(mod_authors) > 1)
-            for (author_name, mod_files) in mod_authors.items():
-                need_filename = (len(mod_files) > 1)
-                for (mod_filename, mod_full_filename) in mod_files.items():
-                    if mod_full_filename in self.mod_cache:
-                        mod_obj = self.mod_cache[mod_full_filename]
-
-                        # Filename suffix
-                        if need_filename:
-                            filename_suffix = ' (from {})'.format(mod_filename)
-                        else:
-                            filename_suffix = ''
+        shared_sets = {}
+        for ((title_lower, author_lower, mod_filename), mod_full_filename) in name_resolution.items():
+            if mod_full_filename in self.mod_cache:
+                mod_obj = self.mod_cache[mod_full_filename]
+                need_author = (author_count[title_lower] > 1)
+                need_filename = (file_count[(title_lower, author_lower)] > 1)
+
+                # Filename suffix
+                if need_filename:
+                    filename_suffix = ' (from {})'.format(mod_filename)
+                else:
+                    filename_suffix = ''
 
-                        # Construct author suffix.  We don't do this until now because
-                        # our name_resolution dict is all lowercase, which may not be
-                        # appropriate.
-                        if need_author:
-                            author_suffix = ' by {}'.format(mod_obj.mod_author)
-                        else:
-                            author_suffix = ''
-
-                        # Construct wiki filename and display title
-                        new_filename = '{}{}{}'.format(
-                                mod_obj.mod_title,
-                                filename_suffix,
-                                author_suffix,
-                                )
-                        new_title_display = '{}{}'.format(
-                                mod_obj.mod_title,
-                                filename_suffix,
-                                )
-
-                        # This is kind of ridiculous, but it happens once; doublecheck
-                        # to see if the filename conflicts with an author filename.
-                        if new_filename in author_names:
-                            new_filename = '{} by {}'.format(new_filename, author_name)
-
-                        # Now set our information
-                        mod_obj.set_wiki_filename_base(new_filename)
-                        mod_obj.set_title_display(new_title_display)
-                        shared_set.add(mod_obj)
-
-                        # Add this mod to an author obj
-                        if mod_obj.mod_author:
-                            if mod_obj.mod_author not in self.author_cache:
-                                self.author_cache[mod_obj.mod_author] = Author(0,
-                                        initial_status=Author.S_NEW,
-                                        name=mod_obj.mod_author)
-                            self.author_cache[mod_obj.mod_author].add_mod(mod_obj)
-
-            # Now, have each of the mods with a shared name link over to each other.
+                # Construct author suffix.  We don't do this until now because
+                # our name_resolution dict is all lowercase, which may not be
+                # appropriate.
+                if need_author:
+                    author_suffix = ' by {}'.format(mod_obj.mod_author)
+                else:
+                    author_suffix = ''
+
+                # Construct wiki filename and display title
+                new_filename = '{}{}{}'.format(
+                        mod_obj.mod_title,
+                        filename_suffix,
+                        author_suffix,
+                        )
+                new_title_display = '{}{}'.format(
+                        mod_obj.mod_title,
+                        filename_suffix,
+                        )
+
+                # This is kind of ridiculous, but it happens once; doublecheck
+                # to see if the filename conflicts with an author filename.
+                if new_filename in author_names:
+                    new_filename = '{} by {}'.format(new_filename, author_lower)
+
+                # Now set our information
+                mod_obj.set_wiki_filename_base(new_filename)
+                mod_obj.set_title_display(new_title_display)
+                shared_sets.setdefault(title_lower, set()).add(mod_obj)
+
+                # Add this mod to an author obj
+                if mod_obj.mod_author:
+                    if mod_obj.mod_author not in self.author_cache:
+                        self.author_cache[mod_obj.mod_author] = Author(0,
+                                initial_status=Author.S_NEW,
+                                name=mod_obj.mod_author)
+                    self.author_cache[mod_obj.mod_author].add_mod(mod_obj)
+
+        # Now, have each of the mods with a shared name link over to each other.
+        for shared_set in shared_sets.values():
             for mod_obj in shared_set:
                 mod_obj.set_related_links(shared_set - {mod_obj})
 
@@ -2076,7 +2470,6 @@ class App(object):
         # main homepage.  We'll leave it in, though, on the offchance we get
         # some kind of TPSalike and end up being able to use the same modding
         # method for more than one game, as with the BL2/TPS modcabinet.)
-        game_filename = 'Borderlands 3 Mods.md'
         created_pages.add(game_filename)
         self.write_wiki_file(wiki_files,
                 game_filename,
@@ -2106,6 +2499,7 @@ class App(object):
 
         # Write out Author pages
         self.logger.debug('Writing author pages')
+        authors_to_write = []
         for author in self.author_cache.values():
             author_filename = author.wiki_filename()
             if author_filename in reserved_pages:
@@ -2125,15 +2519,11 @@ class App(object):
                 if (author.check_modlist() != Author.S_CACHED
                         or self.author_template_mtime.status != TemplateMTime.S_CACHED
                         or author_filename not in wiki_files):
-                    full_author = os.path.join(self.cabinet_dir, author_filename)
-                    with open(full_author, 'w') as df:
-                        df.write(self.author_template.render({
-                            'author': author,
-                            'base_url': self.base_url,
-                            }))
+                    authors_to_write.append(author)
 
         # Write out our individual mods
         self.logger.debug('Writing individual mod pages')
+        mods_to_write = []
         for mod in self.mod_cache.values():
             mod_filename = mod.wiki_filename()
             if mod_filename in reserved_pages:
@@ -2146,19 +2536,28 @@ class App(object):
                 self.error_list.append(e)
             else:
                 created_pages.add(mod_filename)
-                if (self.mod_template_mtime.status != TemplateMTime.S_CACHED
-                        or mod.status != ModFile.S_CACHED
-                        or mod_filename not in wiki_files):
-                    content = self.mod_template.render({
-                        'mod': mod,
-                        'base_url': self.base_url,
-                        'dl_base_url': self.dl_base_url,
-                        'cats': self.categories,
-                        'authors': self.author_cache,
-                        })
-                    full_filename = os.path.join(self.cabinet_dir, mod_filename)
-                    with open(full_filename, 'w') as df:
-                        df.write(content)
+                # Only bother rendering if something which ends up on the page
+                # has actually changed.  Mods with errors get re-parsed on every
+                # run, for instance, but keep their previous render key through
+                # that (see `ModFile.carry_over`), and their pages rarely change.
+                render_changed = mod.check_render_key(
+                        self.mod_template_mtime.content_hash,
+                        self.base_url,
+                        self.dl_base_url,
+                        )
+                if render_changed or mod_filename not in wiki_files:
+                    if render_changed:
+                        self.mod_cache.dirty = True
+                    mods_to_write.append(mod)
+
+        # Now actually render and write out the author and mod pages which
+        # need it.  Template rendering is thread-safe, and this lets us
+        # overlap the rendering with the disk writes.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda author: self.write_author_page(wiki_files, author),
+                authors_to_write))
+            list(executor.map(lambda mod: self.write_mod_page(wiki_files, mod),
+                mods_to_write))
 
         # Finally, our 'Status' page.  This always gets written.
         self.logger.debug('Writing status page')
@@ -2169,27 +2568,40 @@ class App(object):
                 })
             df.write(content)
 
+        # Forget about any pages we didn't write this time around
+        for filename in [f for f in self.page_cache.keys() if f not in created_pages]:
+            del self.page_cache[filename]
+
         # Commit-related git actions
         if do_git and do_git_commit:
 
             self.logger.debug('Prepping for wiki repo commit')
 
-            # Delete pages which no longer exist
-            for filename in wiki_files:
-                if filename not in created_pages:
-                    try:
-                        self.logger.debug('Marking file for deletion: {}'.format(filename))
-                        wikirepo.git.rm('--', filename)
-                    except git.exc.GitCommandError as e:
-                        # If I have a file open or whatever in here with a .swp file, or
-                        # if some file exists which is outside the repo, we'll get this
-                        # error.  Let's not die just because of that.
-                        self.logger.error('Could not "git rm" on filename: {}'.format(filename))
+            # Delete pages which no longer exist.  We try to do these all in one
+            # go, but fall back to one at a time if that fails.
+            to_delete = sorted(wiki_files - created_pages)
+            for filename in to_delete:
+                self.logger.debug('Marking file for deletion: {}'.format(filename))
+            if to_delete:
+                try:
+                    wikirepo.git.rm('--', *to_delete)
+                except git.exc.GitCommandError as e:
+                    self.logger.debug('Batched "git rm" failed, retrying one at a time: {}'.format(e))
+                    for filename in to_delete:
+                        try:
+                            wikirepo.git.rm('--', filename)
+                        except git.exc.GitCommandError as e:
+                            # If I have a file open or whatever in here with a .swp file, or
+                            # if some file exists which is outside the repo, we'll get this
+                            # error.  Let's not die just because of that.
+                            self.logger.error('Could not "git rm" on filename: {}'.format(filename))
 
             # Mark any new files as to-be-added
-            for filename in wikirepo.untracked_files:
+            to_add = wikirepo.untracked_files
+            for filename in to_add:
                 self.logger.debug('Marking file for addition: {}'.format(filename))
-                wikirepo.git.add('--', filename)
+            if to_add:
+                wikirepo.git.add('--', *to_add)
 
             # Commit all wiki changes and push, if we need to (which we should, since About
             # always gets updated)
@@ -2208,41 +2620,129 @@ class App(object):
         self.readme_cache.save()
         self.author_cache.save()
         self.templatemtime_cache.save()
+        self.page_cache.save()
+
+    def _scan(self, root):
+        """
+        Walks the directory tree starting at `root`, yielding a tuple of
+        the directory path and its list of filenames, for each directory
+        which contains at least one file which looks like a mod.  This
+        visits directories in the same order as `os.walk()`, but doesn't
+        bother descending into `.git`, and uses the `DirEntry` type info
+        from `os.scandir()` to avoid extra stat calls.
+        """
+        mod_suffixes = tuple('.{}'.format(ext) for ext in self.mod_extensions)
+        stack = [root]
+        while stack:
+            dirpath = stack.pop()
+            subdirs = []
+            filenames = []
+            has_mods = False
+            try:
+                with os.scandir(dirpath) as it:
+                    for entry in it:
+                        if entry.is_dir():
+                            if entry.name != '.git' and not entry.is_symlink():
+                                subdirs.append(entry.path)
+                        else:
+                            filenames.append(entry.name)
+                            if entry.name.lower().endswith(mod_suffixes):
+                                has_mods = True
+            except OSError:
+                continue
+            if has_mods:
+                yield (dirpath, filenames)
+            stack.extend(reversed(subdirs))
+
+    def write_author_page(self, wiki_files, author):
+        """
+        Renders and writes out the wiki page for the given `author`
+        """
+        self.write_wiki_file(wiki_files,
+                author.wiki_filename(),
+                self.author_template.render({
+                    'author': author,
+                    'base_url': self.base_url,
+                    }),
+                )
+
+    def write_mod_page(self, wiki_files, mod):
+        """
+        Renders and writes out the wiki page for the given `mod`
+        """
+        self.write_wiki_file(wiki_files,
+                mod.wiki_filename(),
+                self.mod_template.render({
+                    'mod': mod,
+                    'base_url': self.base_url,
+                    'dl_base_url': self.dl_base_url,
+                    'cats': self.categories,
+                    'authors': self.author_cache,
+                    }),
+                )
 
     def write_wiki_file(self, wiki_files, filename, content):
         """
-        Write out a file to the wiki, so long as the content has changed
+        Write out a file to the wiki, so long as the content has changed.
+        Rather than reading the current file back in to compare, we check
+        against the hash of what we last wrote, so long as the file doesn't
+        look like it's been touched since.  If it has (or we don't know
+        about it yet), we hash what's on disk instead.
         """
-        # TODO: is this method, um, dumb?  It's only used on staticish pages, so
-        # we should maybe just write indiscriminately.  Or maybe use a FileCache?
         full_filename = os.path.join(self.cabinet_dir, filename)
-        do_write = True
+        new_hash = data_hash(content.encode('utf-8'))
         if filename in wiki_files:
-            with open(full_filename) as df:
-                cur_content = df.read()
-                if cur_content == content:
-                    do_write = False
-        if do_write:
-            with open(full_filename, 'w') as df:
-                df.write(content)
+            mtime = os.stat(full_filename).st_mtime
+            if filename in self.page_cache:
+                page = self.page_cache[filename]
+                if page.content_hash == new_hash and page.mtime == mtime:
+                    return
+            if content_hash(full_filename) == new_hash:
+                page = WikiPage(mtime, initial_status=WikiPage.S_NEW)
+                page.content_hash = new_hash
+                self.page_cache[filename] = page
+                return
+        with open(full_filename, 'w', encoding='utf-8') as df:
+            df.write(content)
+        page = WikiPage(os.stat(full_filename).st_mtime, initial_status=WikiPage.S_NEW)
+        page.content_hash = new_hash
+        self.page_cache[filename] = page
 
     def do_initial_tasks(self):
         """
         Initial first-time-run tasks which need to happen.  Namely: update
         all the file mtimes in the git repo checkout to match their git-tree
-        mtimes.  This is something which we could also just do as we loop
-        through the repo, instead, but I don't really care enough to figure
-        out how to use the more-efficient low-level gitpython functions to
-        do the lookups, as opposed to the higher-level API that we're using.
+        mtimes.  Rather than asking git about each file individually, we
+        grab the whole log (with the files changed in each commit) in a
+        single call, and take the first timestamp we see for each file,
+        since the log is newest-first.
         """
 
         repo = git.Repo(self.repo_dir)
-        for (dirpath, dirnames, filenames) in os.walk(self.repo_dir):
-            if '.git' not in dirpath:
-                for filename in filenames:
-                    full_filename = os.path.join(dirpath, filename)
-                    try:
-                        git_mtime = int(repo.git.log('-n', '1', '--format=%ct', full_filename))
-                        os.utime(full_filename, (git_mtime, git_mtime))
-                    except ValueError as e:
-                        print('ERROR: Invalid mtime returned for {}'.format(full_filename))
+
+        # Using `-z` means we don't have to worry about git quoting any
+        # "unusual" filenames.  Each commit then shows up as an empty field
+        # followed by its timestamp, and then the files which it changed.
+        # The first filename in each commit is prefixed with a newline.
+        log = repo.git.log('--format=%x00%ct', '--name-only', '-z')
+        git_mtimes = {}
+        cur_mtime = None
+        expect_mtime = False
+        for field in log.split('\0'):
+            if field == '':
+                expect_mtime = True
+            elif expect_mtime:
+                cur_mtime = int(field)
+                expect_mtime = False
+            else:
+                if field.startswith('\n'):
+                    field = field[1:]
+                git_mtimes.setdefault(field, cur_mtime)
+
+        # Files which have since been deleted will show up in the log, too,
+        # so just skip anything we can't find.
+        for (filename, git_mtime) in git_mtimes.items():
+            try:
+                os.utime(os.path.join(self.repo_dir, filename), (git_mtime, git_mtime))
+            except (FileNotFoundError, NotADirectoryError):
+                pass
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+# vim: set expandtab tabstop=4 shiftwidth=4:
+
+# Copyright 2019-2020 Christopher J. Kucera
+# <cj@apocalyptech.com>
+# <http://apocalyptech.com/contact.php>
+#
+# This file is part of Borderlands 3 ModCabinet Sorter.
+#
+# Borderlands 3 ModCabinet Sorter is free software: you can redistribute it
+# and/or modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version.
+#
+# Borderlands 3 ModCabinet Sorter is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Borderlands 3 ModCabinet Sorter.  If not, see
+# <https://www.gnu.org/licenses/>.
+
+
+import types
+
+def make_valid_categories(*keys):
+    """
+    Returns a valid-category table for the given category `keys`, which
+    maps each key to itself, as in the app itself.  It's read-only, so
+    that no test can change it out from under any other.  Note that it
+    can't be pickled, so tests which send it to a process pool need to
+    pass along a `dict()` copy instead.
+    """
+    return types.MappingProxyType({key: key for key in keys})
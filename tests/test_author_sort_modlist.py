@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# vim: set expandtab tabstop=4 shiftwidth=4:
+
+# Copyright 2019-2020 Christopher J. Kucera
+# <cj@apocalyptech.com>
+# <http://apocalyptech.com/contact.php>
+#
+# This file is part of Borderlands 3 ModCabinet Sorter.
+#
+# Borderlands 3 ModCabinet Sorter is free software: you can redistribute it
+# and/or modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version.
+#
+# Borderlands 3 ModCabinet Sorter is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Borderlands 3 ModCabinet Sorter.  If not, see
+# <https://www.gnu.org/licenses/>.
+
+import unittest
+from bl3cabinetsorter.app import Author
+
+class AuthorSortModlistTests(unittest.TestCase):
+    """
+    Testing sorting an author's list of mod links
+    """
+
+    def setUp(self):
+        """
+        Initialize some vars we'll need on every test
+        """
+        self.author = Author(0, name='Author')
+
+    def test_empty(self):
+        self.assertEqual(self.author.sort_modlist([]), [])
+
+    def test_wiki_links(self):
+        self.assertEqual(self.author.sort_modlist([
+            '[[Zebra|zebra]]',
+            '[[apple|Apple]]',
+            ]), [
+            '[[apple|Apple]]',
+            '[[Zebra|zebra]]',
+            ])
+
+    def test_html_links(self):
+        self.assertEqual(self.author.sort_modlist([
+            '<a href="zebra">Zebra</a>',
+            '<a href="apple">Apple</a>',
+            ]), [
+            '<a href="apple">Apple</a>',
+            '<a href="zebra">Zebra</a>',
+            ])
+
+    def test_mixed_links(self):
+        self.assertEqual(self.author.sort_modlist([
+            '[[Zebra|zebra]]',
+            '<a href="m">Middle &amp; More</a>',
+            '[[Apple|apple]]',
+            ]), [
+            '[[Apple|apple]]',
+            '<a href="m">Middle &amp; More</a>',
+            '[[Zebra|zebra]]',
+            ])
+
+    def test_other_text(self):
+        self.assertEqual(self.author.sort_modlist([
+            'Zebra',
+            '[[Middle|middle]]',
+            'apple',
+            ]), [
+            'apple',
+            '[[Middle|middle]]',
+            'Zebra',
+            ])
@@ -61,7 +61,7 @@ class DirInfoTests(unittest.TestCase):
 
     def test_author_level_3(self):
         author = 'Username'
-        dirname = '{}/Mod Name'.format(author)
+        dirname = f'{author}/Mod Name'
         info = self.new_dirinfo(dirname, [])
         self.assertEqual(info.dir_author, author)
 
@@ -82,6 +82,14 @@ class DirInfoTests(unittest.TestCase):
         self.assertEqual(info.readme, None)
         self.assertEqual(info.get_all_with_ext('txt'), [])
 
+    def test_casefolded(self):
+        dirname = 'Username'
+        filename = 'Straße.bl3hotfix'
+        info = self.new_dirinfo(dirname, [filename])
+        self.assertIn('STRASSE.BL3HOTFIX', info)
+        self.assertEqual(info['strasse.bl3hotfix'], os.path.join(self.base_dir, dirname, filename))
+        self.assertEqual(info.get_all_with_ext('bl3hotfix'), ['strasse.bl3hotfix'])
+
     def test_one_file_with_ext(self):
         dirname = 'Username'
         filename = 'filename.txt'
@@ -100,6 +108,38 @@ class DirInfoTests(unittest.TestCase):
         self.assertEqual(info.get_all_no_ext(), [])
         self.assertEqual(sorted(info.get_all_with_ext('txt')), [filename1, filename2])
 
+    def test_files_sorted(self):
+        dirname = 'Username'
+        info = self.new_dirinfo(dirname, ['c.txt', 'a.txt', 'b.txt', 'z', 'y'])
+        self.assertEqual(info.get_all_with_ext('txt'), ['a.txt', 'b.txt', 'c.txt'])
+        self.assertEqual(info.get_all_no_ext(), ['y', 'z'])
+
+    def test_files_with_exts(self):
+        dirname = 'Username'
+        filename1 = 'filename1.txt'
+        filename2 = 'filename2.bl3hotfix'
+        filename3 = 'filename3.bl3hotfix.gz'
+        filename4 = 'filename4.md'
+        info = self.new_dirinfo(dirname, [filename1, filename2, filename3, filename4])
+        self.assertEqual(info.get_all_with_exts(['bl3hotfix', 'bl3hotfix.gz', 'txt']),
+                [filename2, filename3, filename1])
+        self.assertEqual(info.get_all_with_exts(['doc']), [])
+
+    def test_dotfile_ext(self):
+        dirname = 'Username'
+        filename = '.bl3hotfix'
+        info = self.new_dirinfo(dirname, [filename])
+        self.assertEqual(info.get_all_no_ext(), [])
+        self.assertEqual(info.get_all_with_ext('bl3hotfix'), [filename])
+
+    def test_single_gz_ext(self):
+        dirname = 'Username'
+        filename = 'filename.gz'
+        info = self.new_dirinfo(dirname, [filename])
+        self.assertEqual(info.get_all_no_ext(), [])
+        self.assertEqual(info.get_all_with_ext('gz'), [])
+        self.assertEqual(info.get_all_with_ext('filename.gz'), [filename])
+
     def test_readme(self):
         dirname = 'Username'
         filename = 'readme.txt'
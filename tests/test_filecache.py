@@ -23,12 +23,14 @@
 
 import os
 import io
-import lzma
 import json
+import datetime
 import shutil
 import unittest
 import tempfile
-from bl3cabinetsorter.app import FileCache, ModFile, Readme, DirInfo
+import concurrent.futures
+from bl3cabinetsorter.app import FileCache, ModFile, Readme, Author, WikiPage, DirInfo, content_hash, cache_read, cache_write
+from tests.helpers import make_valid_categories
 
 class FileCacheTests(unittest.TestCase):
     """
@@ -37,22 +39,42 @@ class FileCacheTests(unittest.TestCase):
     to be sure.
     """
 
-    valid_cats = {
-            'cat1': 'Category One',
-            'cat2': 'Category Two',
-            }
+    valid_cats = make_valid_categories('cat1', 'cat2')
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
-        Things we need to do to start up every test in here
+        Creates a single temp dir for the whole class; each test gets
+        its own subdirectory inside it.  This lives on tmpfs when we're
+        somewhere that has it, since these tests write a lot of little
+        files.  The `BL3CAB_TESTTMP` environment variable can be set to
+        use some other base dir instead.
+        """
+        if os.environ.get('BL3CAB_TESTTMP'):
+            cls.tmproot = tempfile.mkdtemp(dir=os.environ['BL3CAB_TESTTMP'])
+        elif os.path.isdir('/dev/shm'):
+            cls.tmproot = tempfile.mkdtemp(dir='/dev/shm')
+        else:
+            cls.tmproot = tempfile.mkdtemp()
+
+        # A basic serialized mod which a number of our tests start out with
+        mod = ModFile(0)
+        mod.mod_title = 'Testing Mod'
+        cls.testing_mod_serialized = mod.serialize()
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Cleans up everything our tests created, all in one go
         """
-        self.tmpdir = tempfile.mkdtemp()
+        shutil.rmtree(cls.tmproot, ignore_errors=True)
 
-    def tearDown(self):
+    def setUp(self):
         """
-        Cleanup tasks after every test
+        Things we need to do to start up every test in here
         """
-        shutil.rmtree(self.tmpdir)
+        self.tmpdir = os.path.join(self.tmproot, self.id().rsplit('.', 1)[1])
+        os.mkdir(self.tmpdir)
 
     def create_cache(self, filename, cache_dict):
         """
@@ -62,15 +84,36 @@ class FileCacheTests(unittest.TestCase):
         its own functions to save out.
         """
         file_path = os.path.join(self.tmpdir, filename)
-        with lzma.open(file_path, 'wt', encoding='utf-8') as df:
-            json.dump(cache_dict, df)
+        # No need to compress these; uncompressed caches load just fine.
+        cache_write(file_path, json.dumps(cache_dict).encode('utf-8'), compress=False)
         return file_path
 
+    def read_cache(self, file_path):
+        """
+        Reads back the cache at `file_path`, returning its decoded
+        dictionary.  As with `create_cache`, the JSON itself is handled
+        with the stdlib `json` module rather than the app's own functions.
+        """
+        return json.loads(cache_read(file_path))
+
+    def make_dirinfo(self, filenames=None):
+        """
+        Returns a DirInfo for our tmpdir, containing the given list of
+        `filenames` (or just `filename`, by default).  Each test gets a
+        fresh one, since DirInfo remembers things like file mtimes.
+        """
+        if filenames is None:
+            filenames = ['filename']
+        return DirInfo('/tmp/doesnotexist', self.tmpdir, filenames)
+
     def make_path(self, path):
         """
         Creates the `path` inside our tmpdir, and return the full
         path
         """
+        # Most of our files go right in the tmpdir, which already exists
+        if not path:
+            return self.tmpdir
         file_path = os.path.join(self.tmpdir, path)
         os.makedirs(file_path, exist_ok=True)
         return file_path
@@ -82,12 +125,13 @@ class FileCacheTests(unittest.TestCase):
         """
         file_path = self.make_path(path)
         full_file = os.path.join(file_path, filename)
-        with open(full_file, 'w') as df:
-            for line in lines:
-                print(line, file=df)
+        # It's a single write, so there's no point in buffering it
+        with open(full_file, 'wb', buffering=0) as df:
+            df.write(''.join(f'{line}\n' for line in lines).encode('utf-8'))
         if mtime is not None:
-            stat_result = os.stat(full_file)
-            os.utime(full_file, times=(stat_result.st_atime, mtime))
+            # Nothing looks at atimes, so just set both at once
+            mtime_ns = int(mtime * 1_000_000_000)
+            os.utime(full_file, ns=(mtime_ns, mtime_ns))
         return full_file
 
     def test_mod_construct(self):
@@ -104,44 +148,57 @@ class FileCacheTests(unittest.TestCase):
             FileCache(ModFile, filename)
         self.assertIn('up to version', str(cm.exception))
 
-    def test_mod_single(self):
-        mod = ModFile(0)
-        mod.mod_title = 'Testing Mod'
-        filename = self.create_cache('cache', {
-            'version': 1,
-            ModFile.cache_key: {
-                'filename': mod.serialize(),
-                }
-            })
-        cache = FileCache(ModFile, filename)
-        self.assertIsNotNone(cache)
-        self.assertEqual(len(cache), 1)
-        self.assertIn('filename', cache)
-        self.assertEqual(cache['filename'].mod_title, 'Testing Mod')
+    def test_mod_entries(self):
+        titles = [
+                ('filename', 'Testing Mod'),
+                ('filename2', 'Testing Mod 2'),
+                ]
+        for count in [1, 2]:
+            with self.subTest(count=count):
+                entries = titles[:count]
+                serialized = {}
+                for (key, title) in entries:
+                    mod = ModFile(0)
+                    mod.mod_title = title
+                    serialized[key] = mod.serialize()
+                filename = self.create_cache(f'cache{count}', {
+                    'version': 1,
+                    ModFile.cache_key: serialized,
+                    })
+                cache = FileCache(ModFile, filename)
+                self.assertIsNotNone(cache)
+                self.assertEqual(len(cache), count)
+                for (key, title) in entries:
+                    self.assertIn(key, cache)
+                    self.assertEqual(cache[key].mod_title, title)
 
-    def test_mod_two(self):
-        mod = ModFile(0)
-        mod.mod_title = 'Testing Mod'
-        mod2 = ModFile(0)
-        mod2.mod_title = 'Testing Mod 2'
-        filename = self.create_cache('cache', {
-            'version': 1,
-            ModFile.cache_key: {
-                'filename': mod.serialize(),
-                'filename2': mod2.serialize(),
-                }
-            })
-        cache = FileCache(ModFile, filename)
-        self.assertIsNotNone(cache)
-        self.assertEqual(len(cache), 2)
-        self.assertIn('filename', cache)
-        self.assertIn('filename2', cache)
-        self.assertEqual(cache['filename'].mod_title, 'Testing Mod')
-        self.assertEqual(cache['filename2'].mod_title, 'Testing Mod 2')
+    def test_readme_entries(self):
+        texts = [
+                ('filename', 'Testing Readme'),
+                ('filename2', 'Testing Readme 2'),
+                ]
+        for count in [1, 2]:
+            with self.subTest(count=count):
+                entries = texts[:count]
+                serialized = {}
+                for (key, text) in entries:
+                    readme = Readme(0)
+                    readme.mapping['(default)'].append(text)
+                    serialized[key] = readme.serialize()
+                filename = self.create_cache(f'cache{count}', {
+                    'version': 1,
+                    Readme.cache_key: serialized,
+                    })
+                cache = FileCache(Readme, filename)
+                self.assertIsNotNone(cache)
+                self.assertEqual(len(cache), count)
+                for (key, text) in entries:
+                    self.assertIn(key, cache)
+                    self.assertEqual(cache[key].mapping['(default)'], [text])
 
-    def test_readme_single(self):
+    def test_readme_mod_count(self):
         readme = Readme(0)
-        readme.mapping['(default)'].append('Testing Readme')
+        readme.mod_count = 3
         filename = self.create_cache('cache', {
             'version': 1,
             Readme.cache_key: {
@@ -149,42 +206,32 @@ class FileCacheTests(unittest.TestCase):
                 }
             })
         cache = FileCache(Readme, filename)
-        self.assertIsNotNone(cache)
-        self.assertEqual(len(cache), 1)
-        self.assertIn('filename', cache)
-        self.assertEqual(cache['filename'].mapping['(default)'], ['Testing Readme'])
+        self.assertEqual(cache['filename'].mod_count, 3)
 
-    def test_readme_two(self):
-        readme = Readme(0)
-        readme.mapping['(default)'].append('Testing Readme')
-        readme2 = Readme(0)
-        readme2.mapping['(default)'].append('Testing Readme 2')
-        filename = self.create_cache('cache', {
-            'version': 1,
-            Readme.cache_key: {
-                'filename': readme.serialize(),
-                'filename2': readme2.serialize(),
-                }
-            })
-        cache = FileCache(Readme, filename)
-        self.assertIsNotNone(cache)
-        self.assertEqual(len(cache), 2)
-        self.assertIn('filename', cache)
-        self.assertIn('filename2', cache)
-        self.assertEqual(cache['filename'].mapping['(default)'], ['Testing Readme'])
-        self.assertEqual(cache['filename2'].mapping['(default)'], ['Testing Readme 2'])
+    def test_save_empty(self):
+        for cache_class in [ModFile, Readme, Author, WikiPage]:
+            with self.subTest(cache_class=cache_class.__name__):
+                filename = os.path.join(self.tmpdir, f'cache_{cache_class.__name__}')
+                cache = FileCache(cache_class, filename)
+                cache.save()
+                self.assertTrue(os.path.exists(filename))
+                saved = self.read_cache(filename)
+                self.assertEqual(saved, {
+                    'version': FileCache.cache_version,
+                    cache_class.cache_key: {},
+                    })
 
-    def test_save_mod_empty(self):
+    def test_save_uncompressed(self):
         filename = os.path.join(self.tmpdir, 'cache')
-        cache = FileCache(ModFile, filename)
+        cache = FileCache(ModFile, filename, compress=False)
+        cache['filename'] = ModFile(0)
         cache.save()
-        self.assertTrue(os.path.exists(filename))
-        with lzma.open(filename, 'rt', encoding='utf-8') as df:
+        with open(filename, 'rb') as df:
             saved = json.load(df)
-            self.assertEqual(saved, {
-                'version': FileCache.cache_version,
-                ModFile.cache_key: {},
-                })
+        self.assertEqual(saved['version'], FileCache.cache_version)
+        self.assertIn('filename', saved[ModFile.cache_key])
+        cache = FileCache(ModFile, filename)
+        self.assertIn('filename', cache)
 
     def test_save_mod_single(self):
         mod = ModFile(0)
@@ -194,11 +241,10 @@ class FileCacheTests(unittest.TestCase):
         cache.mapping['filename'] = mod
         cache.save()
         self.assertTrue(os.path.exists(filename))
-        with lzma.open(filename, 'rt', encoding='utf-8') as df:
-            saved = json.load(df)
-            self.assertEqual(saved['version'], FileCache.cache_version)
-            self.assertEqual(len(saved[ModFile.cache_key]), 1)
-            self.assertIn('filename', saved[ModFile.cache_key])
+        saved = self.read_cache(filename)
+        self.assertEqual(saved['version'], FileCache.cache_version)
+        self.assertEqual(len(saved[ModFile.cache_key]), 1)
+        self.assertIn('filename', saved[ModFile.cache_key])
 
     def test_save_mod_two(self):
         mod = ModFile(0)
@@ -211,24 +257,11 @@ class FileCacheTests(unittest.TestCase):
         cache.mapping['filename2'] = mod2
         cache.save()
         self.assertTrue(os.path.exists(filename))
-        with lzma.open(filename, 'rt', encoding='utf-8') as df:
-            saved = json.load(df)
-            self.assertEqual(saved['version'], FileCache.cache_version)
-            self.assertEqual(len(saved[ModFile.cache_key]), 2)
-            self.assertIn('filename', saved[ModFile.cache_key])
-            self.assertIn('filename2', saved[ModFile.cache_key])
-
-    def test_save_readme_empty(self):
-        filename = os.path.join(self.tmpdir, 'cache')
-        cache = FileCache(Readme, filename)
-        cache.save()
-        self.assertTrue(os.path.exists(filename))
-        with lzma.open(filename, 'rt', encoding='utf-8') as df:
-            saved = json.load(df)
-            self.assertEqual(saved, {
-                'version': FileCache.cache_version,
-                Readme.cache_key: {},
-                })
+        saved = self.read_cache(filename)
+        self.assertEqual(saved['version'], FileCache.cache_version)
+        self.assertEqual(len(saved[ModFile.cache_key]), 2)
+        self.assertIn('filename', saved[ModFile.cache_key])
+        self.assertIn('filename2', saved[ModFile.cache_key])
 
     def test_save_readme_single(self):
         readme = Readme(0)
@@ -238,11 +271,10 @@ class FileCacheTests(unittest.TestCase):
         cache.mapping['filename'] = readme
         cache.save()
         self.assertTrue(os.path.exists(filename))
-        with lzma.open(filename, 'rt', encoding='utf-8') as df:
-            saved = json.load(df)
-            self.assertEqual(saved['version'], FileCache.cache_version)
-            self.assertEqual(len(saved[Readme.cache_key]), 1)
-            self.assertIn('filename', saved[Readme.cache_key])
+        saved = self.read_cache(filename)
+        self.assertEqual(saved['version'], FileCache.cache_version)
+        self.assertEqual(len(saved[Readme.cache_key]), 1)
+        self.assertIn('filename', saved[Readme.cache_key])
 
     def test_save_readme_two(self):
         readme = Readme(0)
@@ -255,12 +287,52 @@ class FileCacheTests(unittest.TestCase):
         cache.mapping['filename2'] = readme2
         cache.save()
         self.assertTrue(os.path.exists(filename))
-        with lzma.open(filename, 'rt', encoding='utf-8') as df:
-            saved = json.load(df)
-            self.assertEqual(saved['version'], FileCache.cache_version)
-            self.assertEqual(len(saved[Readme.cache_key]), 2)
-            self.assertIn('filename', saved[Readme.cache_key])
-            self.assertIn('filename2', saved[Readme.cache_key])
+        saved = self.read_cache(filename)
+        self.assertEqual(saved['version'], FileCache.cache_version)
+        self.assertEqual(len(saved[Readme.cache_key]), 2)
+        self.assertIn('filename', saved[Readme.cache_key])
+        self.assertIn('filename2', saved[Readme.cache_key])
+
+    def test_save_unchanged(self):
+        filename = self.create_cache('cache', {
+            'version': 1,
+            ModFile.cache_key: {
+                'filename': self.testing_mod_serialized,
+                }
+            })
+        os.utime(filename, times=(42, 42))
+        cache = FileCache(ModFile, filename)
+        cache.save()
+        self.assertEqual(os.stat(filename).st_mtime, 42)
+
+    def test_save_status_changed(self):
+        filename = self.create_cache('cache', {
+            'version': 1,
+            ModFile.cache_key: {
+                'filename': self.testing_mod_serialized,
+                }
+            })
+        os.utime(filename, times=(42, 42))
+        cache = FileCache(ModFile, filename)
+        cache['filename'].set_title_display('Testing Mod Display')
+        cache.save()
+        self.assertNotEqual(os.stat(filename).st_mtime, 42)
+        cache = FileCache(ModFile, filename)
+        self.assertEqual(cache['filename'].mod_title_display, 'Testing Mod Display')
+
+    def test_save_entry_deleted(self):
+        filename = self.create_cache('cache', {
+            'version': 1,
+            ModFile.cache_key: {
+                'filename': self.testing_mod_serialized,
+                }
+            })
+        os.utime(filename, times=(42, 42))
+        cache = FileCache(ModFile, filename)
+        del cache['filename']
+        cache.save()
+        cache = FileCache(ModFile, filename)
+        self.assertEqual(len(cache), 0)
 
     def test_load_mod_not_found(self):
         """
@@ -307,7 +379,7 @@ class FileCacheTests(unittest.TestCase):
         
         # Reload from disk, just in case anything's weird
         cache = FileCache(ModFile, cache_filename)
-        dirinfo = DirInfo('/tmp/doesnotexist', self.tmpdir, ['filename'])
+        dirinfo = self.make_dirinfo()
         loaded_mod = cache.load(dirinfo, 'filename', valid_categories=self.valid_cats)
         self.assertIsNotNone(loaded_mod)
         self.assertEqual(loaded_mod.status, ModFile.S_NEW)
@@ -326,7 +398,7 @@ class FileCacheTests(unittest.TestCase):
         
         # Reload from disk, just in case anything's weird
         cache = FileCache(ModFile, cache_filename)
-        dirinfo = DirInfo('/tmp/doesnotexist', self.tmpdir, ['filename'])
+        dirinfo = self.make_dirinfo()
         loaded_mod = cache.load(dirinfo, 'filename')
         self.assertIsNotNone(loaded_mod)
         self.assertEqual(loaded_mod.status, ModFile.S_CACHED)
@@ -351,13 +423,144 @@ class FileCacheTests(unittest.TestCase):
         
         # Reload from disk, just in case anything's weird
         cache = FileCache(ModFile, cache_filename)
-        dirinfo = DirInfo('/tmp/doesnotexist', self.tmpdir, ['filename'])
+        dirinfo = self.make_dirinfo()
         loaded_mod = cache.load(dirinfo, 'filename', valid_categories=self.valid_cats)
         self.assertIsNotNone(loaded_mod)
         self.assertEqual(loaded_mod.status, ModFile.S_UPDATED)
         self.assertIn(mod_filename, cache)
         self.assertEqual(loaded_mod.mod_desc, ['testing'])
 
+    def test_load_mod_newer_same_contents(self):
+        mod_filename = self.make_file('', 'filename', ['testing'], mtime=84)
+        mod = ModFile(42)
+        mod.mod_title = 'Testing Mod'
+        mod.mod_desc = ['no overwrite']
+        mod.content_hash = content_hash(mod_filename)
+        cache_filename = os.path.join(self.tmpdir, 'cache')
+        cache = FileCache(ModFile, cache_filename)
+        cache.mapping[mod_filename] = mod
+        cache.save()
+
+        # Reload from disk, just in case anything's weird
+        cache = FileCache(ModFile, cache_filename)
+        dirinfo = self.make_dirinfo()
+        loaded_mod = cache.load(dirinfo, 'filename')
+        self.assertIsNotNone(loaded_mod)
+        self.assertEqual(loaded_mod.status, ModFile.S_CACHED)
+        self.assertEqual(loaded_mod.mtime, 84)
+        self.assertEqual(loaded_mod.mod_time, datetime.datetime.fromtimestamp(84))
+        self.assertEqual(loaded_mod.mod_desc, ['no overwrite'])
+        self.assertTrue(cache.dirty)
+
+    def test_load_mod_newer_changed_contents(self):
+        mod_filename = self.make_file('', 'filename', [
+            '# Name: Mod Name',
+            '# Categories: cat1',
+            '# testing',
+            '',
+            'SparkServiceWhatever',
+            ], mtime=84)
+        mod = ModFile(42)
+        mod.mod_title = 'Testing Mod'
+        mod.mod_desc = ['overwrite']
+        mod.content_hash = 'doesnotmatch'
+        cache_filename = os.path.join(self.tmpdir, 'cache')
+        cache = FileCache(ModFile, cache_filename)
+        cache.mapping[mod_filename] = mod
+        cache.save()
+
+        # Reload from disk, just in case anything's weird
+        cache = FileCache(ModFile, cache_filename)
+        dirinfo = self.make_dirinfo()
+        loaded_mod = cache.load(dirinfo, 'filename', valid_categories=self.valid_cats)
+        self.assertIsNotNone(loaded_mod)
+        self.assertEqual(loaded_mod.status, ModFile.S_UPDATED)
+        self.assertEqual(loaded_mod.mod_desc, ['testing'])
+        self.assertEqual(loaded_mod.content_hash, content_hash(mod_filename))
+
+    def test_load_many_mods(self):
+        new_filename = self.make_file('', 'new', [
+            '# Name: New Mod',
+            '# Categories: cat1, cat3',
+            '',
+            'SparkServiceWhatever',
+            ], mtime=42)
+        cached_filename = self.make_file('', 'cached', ['testing'], mtime=42)
+        self.make_file('', 'notamod', ['testing'], mtime=42)
+        mod = ModFile(42)
+        mod.mod_title = 'Cached Mod'
+        cache_filename = os.path.join(self.tmpdir, 'cache')
+        cache = FileCache(ModFile, cache_filename)
+        cache.mapping[cached_filename] = mod
+        cache.save()
+
+        # Reload from disk, just in case anything's weird
+        cache = FileCache(ModFile, cache_filename)
+        dirinfo = self.make_dirinfo(['new', 'cached', 'notamod'])
+        errors = []
+        valid_cats = dict(self.valid_cats)
+        with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+            loaded = cache.load_many(executor,
+                    [(dirinfo, 'new'), (dirinfo, 'cached'), (dirinfo, 'notamod')],
+                    error_list=errors,
+                    valid_categories=valid_cats,
+                    )
+        self.assertEqual(len(loaded), 2)
+        self.assertEqual(loaded[new_filename].mod_title, 'New Mod')
+        self.assertEqual(loaded[new_filename].status, ModFile.S_NEW)
+        self.assertIs(loaded[new_filename].error_list, errors)
+        # Parsed in another process, but should still end up with our own
+        # category objects rather than copies
+        self.assertIs(loaded[new_filename].valid_categories, valid_cats)
+        (cat,) = loaded[new_filename].categories
+        self.assertIs(cat, self.valid_cats['cat1'])
+        self.assertEqual(loaded[cached_filename].mod_title, 'Cached Mod')
+        self.assertEqual(loaded[cached_filename].status, ModFile.S_CACHED)
+        self.assertIn(new_filename, cache)
+        self.assertEqual(len(errors), 1)
+        self.assertIn('cat3', errors[0])
+
+    def test_load_mod_with_errors_keeps_render_key(self):
+        # Mods with errors get re-parsed on every run; make sure that doesn't
+        # mean their pages get queued for rendering every run, too.
+        self.make_file('', 'filename', [
+            '# Name: Half Broken',
+            '# Categories: cat1, cat3',
+            '',
+            'SparkServiceWhatever',
+            ], mtime=42)
+        cache_filename = os.path.join(self.tmpdir, 'cache')
+        for run in range(2):
+            with self.subTest(run=run):
+                cache = FileCache(ModFile, cache_filename)
+                loaded_mod = cache.load(self.make_dirinfo(), 'filename',
+                        error_list=[], valid_categories=self.valid_cats)
+                self.assertTrue(loaded_mod.has_errors())
+                self.assertEqual(loaded_mod.check_render_key('template'), run == 0)
+                cache.save()
+
+    def test_load_many_mod_with_errors_keeps_render_key(self):
+        self.make_file('', 'filename', [
+            '# Name: Half Broken',
+            '# Categories: cat1, cat3',
+            '',
+            'SparkServiceWhatever',
+            ], mtime=42)
+        cache_filename = os.path.join(self.tmpdir, 'cache')
+        for run in range(2):
+            with self.subTest(run=run):
+                cache = FileCache(ModFile, cache_filename)
+                with concurrent.futures.ProcessPoolExecutor(max_workers=1) as executor:
+                    loaded = cache.load_many(executor,
+                            [(self.make_dirinfo(), 'filename')],
+                            error_list=[],
+                            valid_categories=dict(self.valid_cats),
+                            )
+                (loaded_mod,) = loaded.values()
+                self.assertTrue(loaded_mod.has_errors())
+                self.assertEqual(loaded_mod.check_render_key('template'), run == 0)
+                cache.save()
+
     def test_load_readme_new_file(self):
         readme_filename = self.make_file('', 'filename', ['testing'], mtime=42)
         cache_filename = os.path.join(self.tmpdir, 'cache')
@@ -366,7 +569,7 @@ class FileCacheTests(unittest.TestCase):
         
         # Reload from disk, just in case anything's weird
         cache = FileCache(Readme, cache_filename)
-        dirinfo = DirInfo('/tmp/doesnotexist', self.tmpdir, ['filename'])
+        dirinfo = self.make_dirinfo()
         loaded_readme = cache.load(dirinfo, 'filename')
         self.assertIsNotNone(loaded_readme)
         self.assertEqual(loaded_readme.status, ModFile.S_NEW)
@@ -384,7 +587,7 @@ class FileCacheTests(unittest.TestCase):
         
         # Reload from disk, just in case anything's weird
         cache = FileCache(Readme, cache_filename)
-        dirinfo = DirInfo('/tmp/doesnotexist', self.tmpdir, ['filename'])
+        dirinfo = self.make_dirinfo()
         loaded_readme = cache.load(dirinfo, 'filename')
         self.assertIsNotNone(loaded_readme)
         self.assertEqual(loaded_readme.status, ModFile.S_CACHED)
@@ -402,7 +605,7 @@ class FileCacheTests(unittest.TestCase):
         
         # Reload from disk, just in case anything's weird
         cache = FileCache(Readme, cache_filename)
-        dirinfo = DirInfo('/tmp/doesnotexist', self.tmpdir, ['filename'])
+        dirinfo = self.make_dirinfo()
         loaded_readme = cache.load(dirinfo, 'filename')
         self.assertIsNotNone(loaded_readme)
         self.assertEqual(loaded_readme.status, ModFile.S_UPDATED)
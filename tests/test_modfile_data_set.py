@@ -22,51 +22,101 @@
 # <https://www.gnu.org/licenses/>.
 
 import unittest
-from bl3cabinetsorter.app import ModFile
+from bl3cabinetsorter.app import ModFile, Readme
+
+# `(initial_status, end_status)` pairs for when a data-setting method is
+# called with the data we already had...
+UNCHANGED_STATUSES = [
+        (ModFile.S_UNKNOWN, ModFile.S_UNKNOWN),
+        (ModFile.S_CACHED, ModFile.S_CACHED),
+        (ModFile.S_NEW, ModFile.S_NEW),
+        (ModFile.S_UPDATED, ModFile.S_UPDATED),
+        ]
+
+# ... and for when it's called with something different.
+CHANGED_STATUSES = [
+        (ModFile.S_UNKNOWN, ModFile.S_UPDATED),
+        (ModFile.S_CACHED, ModFile.S_UPDATED),
+        (ModFile.S_NEW, ModFile.S_NEW),
+        (ModFile.S_UPDATED, ModFile.S_UPDATED),
+        ]
 
-# TODO: These tests are failing even on the original cabinetsorter.
-# Get that sorted out.
-@unittest.skip("Skipping broken ModFileDataSetTest tests...")
 class ModFileDataSetTests(unittest.TestCase):
     """
     Testing our various ModFile data-setting methods (mostly to make sure
     that we're setting our Cacheable statuses properly.
     """
 
-    def test_readme_unchanged(self):
-        for (initial_status, end_status) in [
-                (ModFile.S_UNKNOWN, ModFile.S_UNKNOWN),
-                (ModFile.S_CACHED, ModFile.S_CACHED),
-                (ModFile.S_NEW, ModFile.S_NEW),
-                (ModFile.S_UPDATED, ModFile.S_UPDATED),
-                ]:
+    def check_readme_desc(self, statuses, readme, new_desc):
+        """
+        Checks updating a fresh ModFile's README description to `new_desc`
+        (from `readme`), for each `(initial_status, end_status)` pair in
+        `statuses`.
+        """
+        for (initial_status, end_status) in statuses:
             with self.subTest(initial_status=initial_status):
                 modfile = ModFile(0, initial_status=initial_status)
                 self.assertFalse(modfile.seen)
                 self.assertEqual(modfile.readme_desc, [])
                 self.assertEqual(modfile.status, initial_status)
 
-                modfile.update_readme_desc([])
+                modfile.update_readme_desc(readme, new_desc)
 
                 self.assertTrue(modfile.seen)
-                self.assertEqual(modfile.readme_desc, [])
+                self.assertEqual(modfile.readme_desc, new_desc)
+                if readme:
+                    self.assertEqual(modfile.readme_rel, readme.rel_filename)
+                else:
+                    self.assertIsNone(modfile.readme_rel)
                 self.assertEqual(modfile.status, end_status)
 
+    def test_readme_unchanged(self):
+        self.check_readme_desc(UNCHANGED_STATUSES, None, [])
+
     def test_readme_updated(self):
-        for (initial_status, end_status) in [
-                (ModFile.S_UNKNOWN, ModFile.S_UPDATED),
-                (ModFile.S_CACHED, ModFile.S_UPDATED),
-                (ModFile.S_NEW, ModFile.S_NEW),
-                (ModFile.S_UPDATED, ModFile.S_UPDATED),
-                ]:
+        readme = Readme(0)
+        readme.rel_filename = 'README.md'
+        self.check_readme_desc(CHANGED_STATUSES, readme, ['readme'])
+
+    def test_readme_new_file(self):
+        readme = Readme(0)
+        readme.rel_filename = 'README.md'
+        self.check_readme_desc(CHANGED_STATUSES, readme, [])
+
+class ModFileMarkUpdatedTests(unittest.TestCase):
+    """
+    Testing the status transition when a ModFile's data changes
+    """
+
+    def test_mark_updated(self):
+        for (initial_status, end_status) in CHANGED_STATUSES:
             with self.subTest(initial_status=initial_status):
                 modfile = ModFile(0, initial_status=initial_status)
-                self.assertFalse(modfile.seen)
-                self.assertEqual(modfile.readme_desc, [])
-                self.assertEqual(modfile.status, initial_status)
+                modfile.mark_updated()
+                self.assertEqual(modfile.status, end_status)
 
-                modfile.update_readme_desc(['readme'])
+    def test_set_title_display(self):
+        for (initial_status, end_status) in CHANGED_STATUSES:
+            with self.subTest(initial_status=initial_status):
+                modfile = ModFile(0, initial_status=initial_status)
+                modfile.set_title_display('Title')
+                self.assertTrue(modfile.seen)
+                self.assertEqual(modfile.mod_title_display, 'Title')
+                self.assertEqual(modfile.status, end_status)
 
+    def test_update_changelog(self):
+        for (initial_status, end_status) in CHANGED_STATUSES:
+            with self.subTest(initial_status=initial_status):
+                modfile = ModFile(0, initial_status=initial_status)
+                modfile.update_changelog(['change'])
+                self.assertTrue(modfile.seen)
+                self.assertEqual(modfile.changelog, ['change'])
+                self.assertEqual(modfile.status, end_status)
+
+    def test_update_changelog_unchanged(self):
+        for (initial_status, end_status) in UNCHANGED_STATUSES:
+            with self.subTest(initial_status=initial_status):
+                modfile = ModFile(0, initial_status=initial_status)
+                modfile.update_changelog([])
                 self.assertTrue(modfile.seen)
-                self.assertEqual(modfile.readme_desc, ['readme'])
                 self.assertEqual(modfile.status, end_status)
@@ -24,6 +24,10 @@
 import io
 import unittest
 from bl3cabinetsorter.app import ModFile, NotAModFile
+from tests.helpers import make_valid_categories
+
+# Stand-in for the actual hotfixes which follow a mod's header comments
+HOTFIX_CONTENTS = 'SparkServiceWhatever\n'
 
 class ModFileTextBlimpTagsTests(unittest.TestCase):
     """
@@ -33,11 +37,7 @@ class ModFileTextBlimpTagsTests(unittest.TestCase):
     https://github.com/apple1417/blcmm-parsing/tree/master/blimp#tag-intepretation
     """
 
-    valid_categories = {
-            'qol': 'Quality of Life',
-            'scaling': 'Scaling',
-            'char-gunner': 'Gunner',
-            }
+    valid_categories = make_valid_categories('qol', 'scaling', 'char-gunner')
 
     def setUp(self):
         """
@@ -46,19 +46,17 @@ class ModFileTextBlimpTagsTests(unittest.TestCase):
         self.errors = []
         self.modfile = ModFile(0, error_list=self.errors, valid_categories=self.valid_categories)
         self.modfile.full_filename = 'modname.bl3hotfix'
-        self.df = io.StringIO()
 
     def set_df_contents(self, lines, do_contents=True, newline_after=True):
         """
         Sets the contents of the "file" that we're gonna read in.
         """
-        for line in lines:
-            print(line, file=self.df)
+        parts = [f'{line}\n' for line in lines]
         if do_contents:
             if newline_after:
-                print('', file=self.df)
-            print('SparkServiceWhatever', file=self.df)
-        self.df.seek(0)
+                parts.append('\n')
+            parts.append(HOTFIX_CONTENTS)
+        self.df = io.StringIO(''.join(parts))
 
     def test_load_only_name(self):
         self.set_df_contents([
@@ -83,7 +81,7 @@ class ModFileTextBlimpTagsTests(unittest.TestCase):
             ])
         self.modfile.load_text_hotfixes(self.df)
         self.assertEqual(self.modfile.mod_title, 'Mod Name')
-        self.assertEqual(self.modfile.categories, set(['qol']))
+        self.assertEqual(self.modfile.categories, {'qol'})
         self.assertFalse(self.modfile.has_errors())
 
     def test_load_minimum_headers_comment(self):
@@ -93,7 +91,7 @@ class ModFileTextBlimpTagsTests(unittest.TestCase):
             ])
         self.modfile.load_text_hotfixes(self.df)
         self.assertEqual(self.modfile.mod_title, 'Mod Name')
-        self.assertEqual(self.modfile.categories, set(['qol']))
+        self.assertEqual(self.modfile.categories, {'qol'})
         self.assertFalse(self.modfile.has_errors())
 
     def test_load_minimum_headers_comment_multi(self):
@@ -103,7 +101,7 @@ class ModFileTextBlimpTagsTests(unittest.TestCase):
             ])
         self.modfile.load_text_hotfixes(self.df)
         self.assertEqual(self.modfile.mod_title, 'Mod Name')
-        self.assertEqual(self.modfile.categories, set(['qol']))
+        self.assertEqual(self.modfile.categories, {'qol'})
         self.assertFalse(self.modfile.has_errors())
 
     def test_load_invalid_tags_spaces(self):
@@ -129,7 +127,7 @@ class ModFileTextBlimpTagsTests(unittest.TestCase):
             ])
         self.modfile.load_text_hotfixes(self.df)
         self.assertEqual(self.modfile.mod_title, 'Mod Name: The Reckoning')
-        self.assertEqual(self.modfile.categories, set(['qol']))
+        self.assertEqual(self.modfile.categories, {'qol'})
         self.assertFalse(self.modfile.has_errors())
 
     def test_load_atsign_in_name(self):
@@ -139,7 +137,7 @@ class ModFileTextBlimpTagsTests(unittest.TestCase):
             ])
         self.modfile.load_text_hotfixes(self.df)
         self.assertEqual(self.modfile.mod_title, '@Mod Name')
-        self.assertEqual(self.modfile.categories, set(['qol']))
+        self.assertEqual(self.modfile.categories, {'qol'})
         self.assertFalse(self.modfile.has_errors())
 
     def test_load_unknown_key(self):
@@ -150,7 +148,7 @@ class ModFileTextBlimpTagsTests(unittest.TestCase):
             ])
         self.modfile.load_text_hotfixes(self.df)
         self.assertEqual(self.modfile.mod_title, 'Mod Name')
-        self.assertEqual(self.modfile.categories, set(['qol']))
+        self.assertEqual(self.modfile.categories, {'qol'})
         self.assertTrue(self.modfile.has_errors())
         self.assertIn('Unknown key', self.errors[0])
 
@@ -162,7 +160,7 @@ class ModFileTextBlimpTagsTests(unittest.TestCase):
             ])
         self.modfile.load_text_hotfixes(self.df)
         self.assertEqual(self.modfile.mod_title, 'Mod Name')
-        self.assertEqual(self.modfile.categories, set(['qol']))
+        self.assertEqual(self.modfile.categories, {'qol'})
         self.assertTrue(self.modfile.has_errors())
         self.assertIn('Bare tag', self.errors[0])
 
@@ -186,22 +184,22 @@ class ModFileTextBlimpTagsTests(unittest.TestCase):
             ])
         self.modfile.load_text_hotfixes(self.df)
         self.assertEqual(self.modfile.mod_title, 'Mod Name')
-        self.assertEqual(self.modfile.categories, set(['qol']))
+        self.assertEqual(self.modfile.categories, {'qol'})
         self.assertEqual(self.modfile.version, '1.0.0')
         self.assertEqual(self.modfile.license, 'Public Domain')
         self.assertEqual(self.modfile.license_url, 'https://creativecommons.org/share-your-work/public-domain/')
-        self.assertEqual(set([u.url for u in self.modfile.screenshots]), set([
+        self.assertEqual({u.url for u in self.modfile.screenshots}, {
             'https://i.imgur.com/ClUttYw.gif',
             'https://i.imgur.com/W5BHeOB.jpg',
-            ]))
-        self.assertEqual(set([u.url for u in self.modfile.video_urls]), set([
+            })
+        self.assertEqual({u.url for u in self.modfile.video_urls}, {
             'https://www.youtube.com/watch?v=JiEu23G4onM',
             'https://www.youtube.com/watch?v=d9Gu1PspA3Y',
-            ]))
-        self.assertEqual(set([u.url for u in self.modfile.urls]), set([
+            })
+        self.assertEqual({u.url for u in self.modfile.urls}, {
             'https://borderlands.com/en-US/news/2020-09-10-borderlands-3-patch-hotfixes-sept-10/',
             'https://borderlands.com/en-US/news/2020-09-17-borderlands-3-hotfixes-sept-17/',
-            ]))
+            })
         self.assertEqual(self.modfile.homepage.url, 'https://mod.com/')
         self.assertEqual(self.modfile.nexus_link.url, 'https://www.nexusmods.com/borderlands3/mods/128')
         self.assertEqual(self.modfile.pakfile, 'Z_Mod_P.pak')
@@ -227,22 +225,22 @@ class ModFileTextBlimpTagsTests(unittest.TestCase):
             ])
         self.modfile.load_text_hotfixes(self.df)
         self.assertEqual(self.modfile.mod_title, 'Mod Name')
-        self.assertEqual(self.modfile.categories, set(['qol']))
+        self.assertEqual(self.modfile.categories, {'qol'})
         self.assertEqual(self.modfile.version, '1.0.0')
         self.assertEqual(self.modfile.license, 'Public Domain')
         self.assertEqual(self.modfile.license_url, 'https://creativecommons.org/share-your-work/public-domain/')
-        self.assertEqual(set([u.url for u in self.modfile.screenshots]), set([
+        self.assertEqual({u.url for u in self.modfile.screenshots}, {
             'https://i.imgur.com/ClUttYw.gif',
             'https://i.imgur.com/W5BHeOB.jpg',
-            ]))
-        self.assertEqual(set([u.url for u in self.modfile.video_urls]), set([
+            })
+        self.assertEqual({u.url for u in self.modfile.video_urls}, {
             'https://www.youtube.com/watch?v=JiEu23G4onM',
             'https://www.youtube.com/watch?v=d9Gu1PspA3Y',
-            ]))
-        self.assertEqual(set([u.url for u in self.modfile.urls]), set([
+            })
+        self.assertEqual({u.url for u in self.modfile.urls}, {
             'https://borderlands.com/en-US/news/2020-09-10-borderlands-3-patch-hotfixes-sept-10/',
             'https://borderlands.com/en-US/news/2020-09-17-borderlands-3-hotfixes-sept-17/',
-            ]))
+            })
         self.assertEqual(self.modfile.homepage.url, 'https://mod.com/')
         self.assertEqual(self.modfile.nexus_link.url, 'https://www.nexusmods.com/borderlands3/mods/128')
         self.assertEqual(self.modfile.pakfile, 'Z_Mod_P.pak')
@@ -268,22 +266,22 @@ class ModFileTextBlimpTagsTests(unittest.TestCase):
             ])
         self.modfile.load_text_hotfixes(self.df)
         self.assertEqual(self.modfile.mod_title, 'Mod Name')
-        self.assertEqual(self.modfile.categories, set(['qol']))
+        self.assertEqual(self.modfile.categories, {'qol'})
         self.assertEqual(self.modfile.version, '1.0.0')
         self.assertEqual(self.modfile.license, 'Public Domain')
         self.assertEqual(self.modfile.license_url, 'https://creativecommons.org/share-your-work/public-domain/')
-        self.assertEqual(set([u.url for u in self.modfile.screenshots]), set([
+        self.assertEqual({u.url for u in self.modfile.screenshots}, {
             'https://i.imgur.com/ClUttYw.gif',
             'https://i.imgur.com/W5BHeOB.jpg',
-            ]))
-        self.assertEqual(set([u.url for u in self.modfile.video_urls]), set([
+            })
+        self.assertEqual({u.url for u in self.modfile.video_urls}, {
             'https://www.youtube.com/watch?v=JiEu23G4onM',
             'https://www.youtube.com/watch?v=d9Gu1PspA3Y',
-            ]))
-        self.assertEqual(set([u.url for u in self.modfile.urls]), set([
+            })
+        self.assertEqual({u.url for u in self.modfile.urls}, {
             'https://borderlands.com/en-US/news/2020-09-10-borderlands-3-patch-hotfixes-sept-10/',
             'https://borderlands.com/en-US/news/2020-09-17-borderlands-3-hotfixes-sept-17/',
-            ]))
+            })
         self.assertEqual(self.modfile.homepage.url, 'https://mod.com/')
         self.assertEqual(self.modfile.nexus_link.url, 'https://www.nexusmods.com/borderlands3/mods/128')
         self.assertEqual(self.modfile.pakfile, 'Z_Mod_P.pak')
@@ -309,22 +307,22 @@ class ModFileTextBlimpTagsTests(unittest.TestCase):
             ])
         self.modfile.load_text_hotfixes(self.df)
         self.assertEqual(self.modfile.mod_title, 'Mod Name')
-        self.assertEqual(self.modfile.categories, set(['qol']))
+        self.assertEqual(self.modfile.categories, {'qol'})
         self.assertEqual(self.modfile.version, '1.0.0')
         self.assertEqual(self.modfile.license, 'Public Domain')
         self.assertEqual(self.modfile.license_url, 'https://creativecommons.org/share-your-work/public-domain/')
-        self.assertEqual(set([u.url for u in self.modfile.screenshots]), set([
+        self.assertEqual({u.url for u in self.modfile.screenshots}, {
             'https://i.imgur.com/ClUttYw.gif',
             'https://i.imgur.com/W5BHeOB.jpg',
-            ]))
-        self.assertEqual(set([u.url for u in self.modfile.video_urls]), set([
+            })
+        self.assertEqual({u.url for u in self.modfile.video_urls}, {
             'https://www.youtube.com/watch?v=JiEu23G4onM',
             'https://www.youtube.com/watch?v=d9Gu1PspA3Y',
-            ]))
-        self.assertEqual(set([u.url for u in self.modfile.urls]), set([
+            })
+        self.assertEqual({u.url for u in self.modfile.urls}, {
             'https://borderlands.com/en-US/news/2020-09-10-borderlands-3-patch-hotfixes-sept-10/',
             'https://borderlands.com/en-US/news/2020-09-17-borderlands-3-hotfixes-sept-17/',
-            ]))
+            })
         self.assertEqual(self.modfile.homepage.url, 'https://mod.com/')
         self.assertEqual(self.modfile.nexus_link.url, 'https://www.nexusmods.com/borderlands3/mods/128')
         self.assertEqual(self.modfile.pakfile, 'Z_Mod_P.pak')
@@ -350,22 +348,22 @@ class ModFileTextBlimpTagsTests(unittest.TestCase):
             ])
         self.modfile.load_text_hotfixes(self.df)
         self.assertEqual(self.modfile.mod_title, 'Mod Name')
-        self.assertEqual(self.modfile.categories, set(['qol']))
+        self.assertEqual(self.modfile.categories, {'qol'})
         self.assertEqual(self.modfile.version, '1.0.0')
         self.assertEqual(self.modfile.license, 'Public Domain')
         self.assertEqual(self.modfile.license_url, 'https://creativecommons.org/share-your-work/public-domain/')
-        self.assertEqual(set([u.url for u in self.modfile.screenshots]), set([
+        self.assertEqual({u.url for u in self.modfile.screenshots}, {
             'https://i.imgur.com/ClUttYw.gif',
             'https://i.imgur.com/W5BHeOB.jpg',
-            ]))
-        self.assertEqual(set([u.url for u in self.modfile.video_urls]), set([
+            })
+        self.assertEqual({u.url for u in self.modfile.video_urls}, {
             'https://www.youtube.com/watch?v=JiEu23G4onM',
             'https://www.youtube.com/watch?v=d9Gu1PspA3Y',
-            ]))
-        self.assertEqual(set([u.url for u in self.modfile.urls]), set([
+            })
+        self.assertEqual({u.url for u in self.modfile.urls}, {
             'https://borderlands.com/en-US/news/2020-09-10-borderlands-3-patch-hotfixes-sept-10/',
             'https://borderlands.com/en-US/news/2020-09-17-borderlands-3-hotfixes-sept-17/',
-            ]))
+            })
         self.assertEqual(self.modfile.homepage.url, 'https://mod.com/')
         self.assertEqual(self.modfile.nexus_link.url, 'https://www.nexusmods.com/borderlands3/mods/128')
         self.assertEqual(self.modfile.pakfile, 'Z_Mod_P.pak')
@@ -448,7 +446,7 @@ class ModFileTextBlimpTagsTests(unittest.TestCase):
             '@categories qol, qol',
             ])
         self.modfile.load_text_hotfixes(self.df)
-        self.assertEqual(self.modfile.categories, set(['qol']))
+        self.assertEqual(self.modfile.categories, {'qol'})
         self.assertFalse(self.modfile.has_errors())
 
     def test_multiple_categories(self):
@@ -457,7 +455,7 @@ class ModFileTextBlimpTagsTests(unittest.TestCase):
             '@categories qol, scaling',
             ])
         self.modfile.load_text_hotfixes(self.df)
-        self.assertEqual(self.modfile.categories, set(['scaling', 'qol']))
+        self.assertEqual(self.modfile.categories, {'scaling', 'qol'})
         self.assertFalse(self.modfile.has_errors())
 
     def test_multiple_categories_on_multi_lines(self):
@@ -467,7 +465,7 @@ class ModFileTextBlimpTagsTests(unittest.TestCase):
             '@categories scaling',
             ])
         self.modfile.load_text_hotfixes(self.df)
-        self.assertEqual(self.modfile.categories, set(['scaling', 'qol']))
+        self.assertEqual(self.modfile.categories, {'scaling', 'qol'})
         self.assertFalse(self.modfile.has_errors())
 
     def test_multiple_categories_no_spaces(self):
@@ -476,7 +474,7 @@ class ModFileTextBlimpTagsTests(unittest.TestCase):
             '@categories qol,scaling',
             ])
         self.modfile.load_text_hotfixes(self.df)
-        self.assertEqual(self.modfile.categories, set(['scaling', 'qol']))
+        self.assertEqual(self.modfile.categories, {'scaling', 'qol'})
         self.assertFalse(self.modfile.has_errors())
 
     def test_multiple_categories_extra_spaces(self):
@@ -485,7 +483,7 @@ class ModFileTextBlimpTagsTests(unittest.TestCase):
             '@categories qol   ,     scaling  , char-gunner',
             ])
         self.modfile.load_text_hotfixes(self.df)
-        self.assertEqual(self.modfile.categories, set(['scaling', 'qol', 'char-gunner']))
+        self.assertEqual(self.modfile.categories, {'scaling', 'qol', 'char-gunner'})
         self.assertFalse(self.modfile.has_errors())
 
     def test_invalid_category(self):
@@ -503,7 +501,7 @@ class ModFileTextBlimpTagsTests(unittest.TestCase):
             '@categories qol, bzort',
             ])
         self.modfile.load_text_hotfixes(self.df)
-        self.assertEqual(self.modfile.categories, set(['qol']))
+        self.assertEqual(self.modfile.categories, {'qol'})
         self.assertTrue(self.modfile.has_errors())
         self.assertIn('Invalid category', self.errors[0])
 
@@ -564,7 +562,7 @@ class ModFileTextBlimpTagsTests(unittest.TestCase):
             ])
         self.modfile.load_text_hotfixes(self.df)
         self.assertEqual(self.modfile.mod_title, 'Mod Name')
-        self.assertEqual(self.modfile.categories, set(['qol']))
+        self.assertEqual(self.modfile.categories, {'qol'})
         self.assertEqual(self.modfile.mod_desc, ['Name: Another Name'])
         self.assertFalse(self.modfile.has_errors())
 
@@ -577,7 +575,7 @@ class ModFileTextBlimpTagsTests(unittest.TestCase):
             ])
         self.modfile.load_text_hotfixes(self.df)
         self.assertEqual(self.modfile.mod_title, 'Mod Name')
-        self.assertEqual(self.modfile.categories, set(['qol']))
+        self.assertEqual(self.modfile.categories, {'qol'})
         self.assertEqual(self.modfile.mod_desc, ['@title Another Name', '@categories scaling'])
         self.assertFalse(self.modfile.has_errors())
 
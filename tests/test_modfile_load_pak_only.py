@@ -24,15 +24,14 @@
 import io
 import unittest
 from bl3cabinetsorter.app import ModFile, NotAModFile
+from tests.helpers import make_valid_categories
 
 class ModFileTextPakOnlyTests(unittest.TestCase):
     """
     Testing importing a pakfile-only mod description file.
     """
 
-    valid_categories = {
-            'qol': 'Quality of Life',
-            }
+    valid_categories = make_valid_categories('qol')
 
     def setUp(self):
         """
@@ -42,15 +41,12 @@ class ModFileTextPakOnlyTests(unittest.TestCase):
         self.modfile = ModFile(0, error_list=self.errors, valid_categories=self.valid_categories)
         self.modfile.full_filename = 'modname.bl3pakinfo'
         self.modfile.is_pak_only = True
-        self.df = io.StringIO()
 
     def set_df_contents(self, lines):
         """
         Sets the contents of the "file" that we're gonna read in.
         """
-        for line in lines:
-            print(line, file=self.df)
-        self.df.seek(0)
+        self.df = io.StringIO(''.join(f'{line}\n' for line in lines))
 
     def test_load_no_pakfile(self):
         self.set_df_contents([
@@ -69,7 +65,7 @@ class ModFileTextPakOnlyTests(unittest.TestCase):
             ])
         self.modfile.load_text_hotfixes(self.df)
         self.assertEqual(self.modfile.mod_title, 'Mod Name')
-        self.assertEqual(self.modfile.categories, set(['qol']))
+        self.assertEqual(self.modfile.categories, {'qol'})
         self.assertEqual(self.modfile.pakfile, 'a_mod_9999_p.pak')
         self.assertFalse(self.modfile.has_errors())
 
@@ -24,17 +24,17 @@
 import io
 import unittest
 from bl3cabinetsorter.app import ModFile, NotAModFile
+from tests.helpers import make_valid_categories
+
+# Stand-in for the actual hotfixes which follow a mod's header comments
+HOTFIX_CONTENTS = 'SparkServiceWhatever\n'
 
 class ModFileTextHotfixesTests(unittest.TestCase):
     """
     Testing importing a text-hotfixes-format file.
     """
 
-    valid_categories = {
-            'qol': 'Quality of Life',
-            'scaling': 'Scaling',
-            'char-gunner': 'Gunner',
-            }
+    valid_categories = make_valid_categories('qol', 'scaling', 'char-gunner')
 
     def setUp(self):
         """
@@ -43,19 +43,17 @@ class ModFileTextHotfixesTests(unittest.TestCase):
         self.errors = []
         self.modfile = ModFile(0, error_list=self.errors, valid_categories=self.valid_categories)
         self.modfile.full_filename = 'modname.bl3hotfix'
-        self.df = io.StringIO()
 
     def set_df_contents(self, lines, do_contents=True, newline_after=True):
         """
         Sets the contents of the "file" that we're gonna read in.
         """
-        for line in lines:
-            print(line, file=self.df)
+        parts = [f'{line}\n' for line in lines]
         if do_contents:
             if newline_after:
-                print('', file=self.df)
-            print('SparkServiceWhatever', file=self.df)
-        self.df.seek(0)
+                parts.append('\n')
+            parts.append(HOTFIX_CONTENTS)
+        self.df = io.StringIO(''.join(parts))
 
     def test_load_empty(self):
         self.set_df_contents([], do_contents=False)
@@ -100,7 +98,7 @@ class ModFileTextHotfixesTests(unittest.TestCase):
             ])
         self.modfile.load_text_hotfixes(self.df)
         self.assertEqual(self.modfile.mod_title, 'Mod Name')
-        self.assertEqual(self.modfile.categories, set(['qol']))
+        self.assertEqual(self.modfile.categories, {'qol'})
         self.assertFalse(self.modfile.has_errors())
 
     def test_load_colon_in_name(self):
@@ -110,7 +108,7 @@ class ModFileTextHotfixesTests(unittest.TestCase):
             ])
         self.modfile.load_text_hotfixes(self.df)
         self.assertEqual(self.modfile.mod_title, 'Mod Name: The Reckoning')
-        self.assertEqual(self.modfile.categories, set(['qol']))
+        self.assertEqual(self.modfile.categories, {'qol'})
         self.assertFalse(self.modfile.has_errors())
 
     def test_load_unknown_key(self):
@@ -121,7 +119,7 @@ class ModFileTextHotfixesTests(unittest.TestCase):
             ])
         self.modfile.load_text_hotfixes(self.df)
         self.assertEqual(self.modfile.mod_title, 'Mod Name')
-        self.assertEqual(self.modfile.categories, set(['qol']))
+        self.assertEqual(self.modfile.categories, {'qol'})
         self.assertTrue(self.modfile.has_errors())
         self.assertIn('Unknown key', self.errors[0])
 
@@ -143,22 +141,22 @@ class ModFileTextHotfixesTests(unittest.TestCase):
             ])
         self.modfile.load_text_hotfixes(self.df)
         self.assertEqual(self.modfile.mod_title, 'Mod Name')
-        self.assertEqual(self.modfile.categories, set(['qol']))
+        self.assertEqual(self.modfile.categories, {'qol'})
         self.assertEqual(self.modfile.version, '1.0.0')
         self.assertEqual(self.modfile.license, 'Public Domain')
         self.assertEqual(self.modfile.license_url, 'https://creativecommons.org/share-your-work/public-domain/')
-        self.assertEqual(set([u.url for u in self.modfile.screenshots]), set([
+        self.assertEqual({u.url for u in self.modfile.screenshots}, {
             'https://i.imgur.com/ClUttYw.gif',
             'https://i.imgur.com/W5BHeOB.jpg',
-            ]))
-        self.assertEqual(set([u.url for u in self.modfile.video_urls]), set([
+            })
+        self.assertEqual({u.url for u in self.modfile.video_urls}, {
             'https://www.youtube.com/watch?v=JiEu23G4onM',
             'https://www.youtube.com/watch?v=d9Gu1PspA3Y',
-            ]))
-        self.assertEqual(set([u.url for u in self.modfile.urls]), set([
+            })
+        self.assertEqual({u.url for u in self.modfile.urls}, {
             'https://borderlands.com/en-US/news/2020-09-10-borderlands-3-patch-hotfixes-sept-10/',
             'https://borderlands.com/en-US/news/2020-09-17-borderlands-3-hotfixes-sept-17/',
-            ]))
+            })
         self.assertEqual(self.modfile.nexus_link.url, 'https://www.nexusmods.com/borderlands3/mods/128')
         self.assertFalse(self.modfile.has_errors())
 
@@ -180,22 +178,22 @@ class ModFileTextHotfixesTests(unittest.TestCase):
             ])
         self.modfile.load_text_hotfixes(self.df)
         self.assertEqual(self.modfile.mod_title, 'Mod Name')
-        self.assertEqual(self.modfile.categories, set(['qol']))
+        self.assertEqual(self.modfile.categories, {'qol'})
         self.assertEqual(self.modfile.version, '1.0.0')
         self.assertEqual(self.modfile.license, 'Public Domain')
         self.assertEqual(self.modfile.license_url, 'https://creativecommons.org/share-your-work/public-domain/')
-        self.assertEqual(set([u.url for u in self.modfile.screenshots]), set([
+        self.assertEqual({u.url for u in self.modfile.screenshots}, {
             'https://i.imgur.com/ClUttYw.gif',
             'https://i.imgur.com/W5BHeOB.jpg',
-            ]))
-        self.assertEqual(set([u.url for u in self.modfile.video_urls]), set([
+            })
+        self.assertEqual({u.url for u in self.modfile.video_urls}, {
             'https://www.youtube.com/watch?v=JiEu23G4onM',
             'https://www.youtube.com/watch?v=d9Gu1PspA3Y',
-            ]))
-        self.assertEqual(set([u.url for u in self.modfile.urls]), set([
+            })
+        self.assertEqual({u.url for u in self.modfile.urls}, {
             'https://borderlands.com/en-US/news/2020-09-10-borderlands-3-patch-hotfixes-sept-10/',
             'https://borderlands.com/en-US/news/2020-09-17-borderlands-3-hotfixes-sept-17/',
-            ]))
+            })
         self.assertEqual(self.modfile.nexus_link.url, 'https://www.nexusmods.com/borderlands3/mods/128')
         self.assertFalse(self.modfile.has_errors())
 
@@ -217,22 +215,22 @@ class ModFileTextHotfixesTests(unittest.TestCase):
             ])
         self.modfile.load_text_hotfixes(self.df)
         self.assertEqual(self.modfile.mod_title, 'Mod Name')
-        self.assertEqual(self.modfile.categories, set(['qol']))
+        self.assertEqual(self.modfile.categories, {'qol'})
         self.assertEqual(self.modfile.version, '1.0.0')
         self.assertEqual(self.modfile.license, 'Public Domain')
         self.assertEqual(self.modfile.license_url, 'https://creativecommons.org/share-your-work/public-domain/')
-        self.assertEqual(set([u.url for u in self.modfile.screenshots]), set([
+        self.assertEqual({u.url for u in self.modfile.screenshots}, {
             'https://i.imgur.com/ClUttYw.gif',
             'https://i.imgur.com/W5BHeOB.jpg',
-            ]))
-        self.assertEqual(set([u.url for u in self.modfile.video_urls]), set([
+            })
+        self.assertEqual({u.url for u in self.modfile.video_urls}, {
             'https://www.youtube.com/watch?v=JiEu23G4onM',
             'https://www.youtube.com/watch?v=d9Gu1PspA3Y',
-            ]))
-        self.assertEqual(set([u.url for u in self.modfile.urls]), set([
+            })
+        self.assertEqual({u.url for u in self.modfile.urls}, {
             'https://borderlands.com/en-US/news/2020-09-10-borderlands-3-patch-hotfixes-sept-10/',
             'https://borderlands.com/en-US/news/2020-09-17-borderlands-3-hotfixes-sept-17/',
-            ]))
+            })
         self.assertEqual(self.modfile.nexus_link.url, 'https://www.nexusmods.com/borderlands3/mods/128')
         self.assertFalse(self.modfile.has_errors())
 
@@ -254,22 +252,22 @@ class ModFileTextHotfixesTests(unittest.TestCase):
             ])
         self.modfile.load_text_hotfixes(self.df)
         self.assertEqual(self.modfile.mod_title, 'Mod Name')
-        self.assertEqual(self.modfile.categories, set(['qol']))
+        self.assertEqual(self.modfile.categories, {'qol'})
         self.assertEqual(self.modfile.version, '1.0.0')
         self.assertEqual(self.modfile.license, 'Public Domain')
         self.assertEqual(self.modfile.license_url, 'https://creativecommons.org/share-your-work/public-domain/')
-        self.assertEqual(set([u.url for u in self.modfile.screenshots]), set([
+        self.assertEqual({u.url for u in self.modfile.screenshots}, {
             'https://i.imgur.com/ClUttYw.gif',
             'https://i.imgur.com/W5BHeOB.jpg',
-            ]))
-        self.assertEqual(set([u.url for u in self.modfile.video_urls]), set([
+            })
+        self.assertEqual({u.url for u in self.modfile.video_urls}, {
             'https://www.youtube.com/watch?v=JiEu23G4onM',
             'https://www.youtube.com/watch?v=d9Gu1PspA3Y',
-            ]))
-        self.assertEqual(set([u.url for u in self.modfile.urls]), set([
+            })
+        self.assertEqual({u.url for u in self.modfile.urls}, {
             'https://borderlands.com/en-US/news/2020-09-10-borderlands-3-patch-hotfixes-sept-10/',
             'https://borderlands.com/en-US/news/2020-09-17-borderlands-3-hotfixes-sept-17/',
-            ]))
+            })
         self.assertEqual(self.modfile.nexus_link.url, 'https://www.nexusmods.com/borderlands3/mods/128')
         self.assertFalse(self.modfile.has_errors())
 
@@ -338,7 +336,7 @@ class ModFileTextHotfixesTests(unittest.TestCase):
             '# Categories: qol, qol',
             ])
         self.modfile.load_text_hotfixes(self.df)
-        self.assertEqual(self.modfile.categories, set(['qol']))
+        self.assertEqual(self.modfile.categories, {'qol'})
         self.assertFalse(self.modfile.has_errors())
 
     def test_multiple_categories(self):
@@ -347,7 +345,7 @@ class ModFileTextHotfixesTests(unittest.TestCase):
             '# Categories: qol, scaling',
             ])
         self.modfile.load_text_hotfixes(self.df)
-        self.assertEqual(self.modfile.categories, set(['scaling', 'qol']))
+        self.assertEqual(self.modfile.categories, {'scaling', 'qol'})
         self.assertFalse(self.modfile.has_errors())
 
     def test_multiple_categories_no_spaces(self):
@@ -356,7 +354,7 @@ class ModFileTextHotfixesTests(unittest.TestCase):
             '# Categories: qol,scaling',
             ])
         self.modfile.load_text_hotfixes(self.df)
-        self.assertEqual(self.modfile.categories, set(['scaling', 'qol']))
+        self.assertEqual(self.modfile.categories, {'scaling', 'qol'})
         self.assertFalse(self.modfile.has_errors())
 
     def test_multiple_categories_extra_spaces(self):
@@ -365,9 +363,18 @@ class ModFileTextHotfixesTests(unittest.TestCase):
             '# Categories: qol   ,     scaling  , char-gunner',
             ])
         self.modfile.load_text_hotfixes(self.df)
-        self.assertEqual(self.modfile.categories, set(['scaling', 'qol', 'char-gunner']))
+        self.assertEqual(self.modfile.categories, {'scaling', 'qol', 'char-gunner'})
         self.assertFalse(self.modfile.has_errors())
 
+    def test_categories_use_canonical_keys(self):
+        self.set_df_contents([
+            '# Name: Mod Name',
+            '# Categories: char-gunner',
+            ])
+        self.modfile.load_text_hotfixes(self.df)
+        (cat,) = self.modfile.categories
+        self.assertIs(cat, self.valid_categories['char-gunner'])
+
     def test_invalid_category(self):
         self.set_df_contents([
             '# Name: Mod Name',
@@ -383,7 +390,7 @@ class ModFileTextHotfixesTests(unittest.TestCase):
             '# Categories: qol, bzort',
             ])
         self.modfile.load_text_hotfixes(self.df)
-        self.assertEqual(self.modfile.categories, set(['qol']))
+        self.assertEqual(self.modfile.categories, {'qol'})
         self.assertTrue(self.modfile.has_errors())
         self.assertIn('Invalid category', self.errors[0])
 
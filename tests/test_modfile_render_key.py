@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# vim: set expandtab tabstop=4 shiftwidth=4:
+
+# Copyright 2019-2020 Christopher J. Kucera
+# <cj@apocalyptech.com>
+# <http://apocalyptech.com/contact.php>
+#
+# This file is part of Borderlands 3 ModCabinet Sorter.
+#
+# Borderlands 3 ModCabinet Sorter is free software: you can redistribute it
+# and/or modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version.
+#
+# Borderlands 3 ModCabinet Sorter is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Borderlands 3 ModCabinet Sorter.  If not, see
+# <https://www.gnu.org/licenses/>.
+
+
+import unittest
+from bl3cabinetsorter.app import ModFile
+
+class ModFileRenderKeyTests(unittest.TestCase):
+    """
+    Testing our get_render_key method
+    """
+
+    def setUp(self):
+        """
+        Initialize some vars we'll need on every test
+        """
+        self.modfile = ModFile(0)
+        self.modfile.mod_title = 'Testing Mod'
+        self.modfile.categories = {'qol', 'cheat', 'joke'}
+
+    def test_stable(self):
+        other = ModFile(0)
+        other.mod_title = 'Testing Mod'
+        other.categories = {'joke', 'qol', 'cheat'}
+        self.assertEqual(self.modfile.get_render_key('tmpl'), other.get_render_key('tmpl'))
+
+    def test_ignores_render_key(self):
+        key = self.modfile.get_render_key('tmpl')
+        self.modfile.render_key = key
+        self.assertEqual(self.modfile.get_render_key('tmpl'), key)
+
+    def test_title_changed(self):
+        key = self.modfile.get_render_key('tmpl')
+        self.modfile.mod_title = 'Other Mod'
+        self.assertNotEqual(self.modfile.get_render_key('tmpl'), key)
+
+    def test_date_changed(self):
+        other = ModFile(60*60*24*7)
+        other.mod_title = 'Testing Mod'
+        other.categories = {'joke', 'qol', 'cheat'}
+        self.assertNotEqual(self.modfile.get_render_key('tmpl'), other.get_render_key('tmpl'))
+
+    def test_extra_changed(self):
+        self.assertNotEqual(self.modfile.get_render_key('tmpl'), self.modfile.get_render_key('tmpl2'))
@@ -35,15 +35,12 @@ class ReadmeReadFindMatchingTests(unittest.TestCase):
         Initialize some vars we'll need on every test.
         """
         self.readme = Readme(0)
-        self.df = io.StringIO()
 
     def set_df_contents(self, lines):
         """
         Sets the contents of the "file" that we're gonna read in.
         """
-        for line in lines:
-            print(line, file=self.df)
-        self.df.seek(0)
+        self.df = io.StringIO(''.join(f'{line}\n' for line in lines))
 
     def read(self, lines):
         """
@@ -35,15 +35,12 @@ class ReadmeReadFileObjTests(unittest.TestCase):
         Initialize some vars we'll need on every test.
         """
         self.readme = Readme(0)
-        self.df = io.StringIO()
 
     def set_df_contents(self, lines):
         """
         Sets the contents of the "file" that we're gonna read in.
         """
-        for line in lines:
-            print(line, file=self.df)
-        self.df.seek(0)
+        self.df = io.StringIO(''.join(f'{line}\n' for line in lines))
 
     def read(self):
         """
@@ -84,8 +81,11 @@ class ReadmeReadFileObjTests(unittest.TestCase):
     def test_hash_section(self):
         for hashes in ['#', '##', '###', '####']:
             with self.subTest(hashes=hashes):
+                # Each subtest needs its own readme, otherwise we'd just
+                # be appending to the previous one.
+                self.readme = Readme(0)
                 self.set_df_contents([
-                    '{} Section'.format(hashes),
+                    f'{hashes} Section',
                     'Testing',
                     ])
                 self.read()
@@ -169,6 +169,29 @@ class ReadmeReadFileObjTests(unittest.TestCase):
             })
         self.assertEqual(self.readme.first_section, '(default)')
 
+    def test_partial_double_underline(self):
+        self.set_df_contents([
+            'Section',
+            '===Testing===',
+            ])
+        self.read()
+        self.assertEqual(self.readme.mapping, {
+            '(default)': ['Section', '===Testing==='],
+            })
+        self.assertEqual(self.readme.first_section, '(default)')
+
+    def test_partial_single_underline(self):
+        self.set_df_contents([
+            'Section',
+            '---Testing---',
+            ])
+        self.read()
+        self.assertEqual(self.readme.mapping, {
+            '(default)': ['Section'],
+            'testing---': [],
+            })
+        self.assertEqual(self.readme.first_section, '(default)')
+
     def test_dash_section(self):
         self.set_df_contents([
             '- Section',
@@ -315,3 +338,12 @@ class ReadmeReadFileObjTests(unittest.TestCase):
             '(default)': ['Testing'],
             })
         self.assertEqual(self.readme.first_section, '(default)')
+
+    def test_only_split_on_newlines(self):
+        self.set_df_contents([
+            'Testing\x0cform\x1dfeed\u2028line',
+            ])
+        self.read()
+        self.assertEqual(self.readme.mapping, {
+            '(default)': ['Testing\x0cform\x1dfeed\u2028line'],
+            })